@@ -0,0 +1,107 @@
+"""
+Compares parsing backend responses into dicts and validating them (the old path of the API client) with validating
+raw bytes directly, validating list items one by one with validating the whole list response at once, and the stdlib
+with orjson for encoding request bodies.
+
+Run: python -m benchmarks.api_json_decoding
+"""
+
+import json
+import os
+import timeit
+from datetime import datetime
+
+import orjson
+from pydantic import TypeAdapter
+
+for _name in ("BOT_TOKEN", "API_URL", "API_SECRET"):
+    os.environ.setdefault(_name, "benchmark")
+
+from src.api.schemas.method_input_schemas import CreateTaskBody  # noqa: E402
+from src.api.schemas.method_output_schemas import (  # noqa: E402
+    DailyInfoResponse,
+    RoomInfoResponse,
+    RuleInfo,
+    TaskInfo,
+    TaskListResponse,
+)
+
+
+def make_responses(users_count: int, tasks_count: int) -> dict[str, tuple[type | TypeAdapter, bytes]]:
+    users = [{"id": 100000 + i, "alias": f"user_{i}", "fullname": f"User Number {i}"} for i in range(users_count)]
+    daily_info = {
+        "periodic_tasks": [
+            {"id": i, "name": f"Task {i}", "today_executor": users[i % users_count]["id"]} for i in range(tasks_count)
+        ],
+        "manual_tasks": [
+            {"id": i, "name": f"Manual {i}", "today_executor": users[i % users_count]["id"]}
+            for i in range(tasks_count // 2)
+        ],
+        "user_info": {str(user["id"]): user for user in users},
+    }
+    room_info = {"id": 1, "name": "Room 101", "users": users}
+    tasks = [{"id": i, "name": f"Task {i}", "inactive": i % 4 == 0} for i in range(tasks_count)]
+    rules = [{"id": i, "name": f"Rule {i}", "text": "Keep the room clean. " * 10} for i in range(tasks_count)]
+    return {
+        "daily info": (DailyInfoResponse, json.dumps(daily_info).encode()),
+        "room info": (RoomInfoResponse, json.dumps(room_info).encode()),
+        "task list": (TypeAdapter(list[TaskInfo]), json.dumps(tasks).encode()),
+        "rule list": (TypeAdapter(list[RuleInfo]), json.dumps(rules).encode()),
+    }
+
+
+def old_decode(type_: type | TypeAdapter, body: bytes):
+    data = json.loads(body)
+    if isinstance(type_, TypeAdapter):
+        return type_.validate_python(data)
+    return type_.model_validate(data)
+
+
+def new_decode(type_: type | TypeAdapter, body: bytes):
+    if isinstance(type_, TypeAdapter):
+        return type_.validate_json(body)
+    return type_.model_validate_json(body)
+
+
+def measure(func, number: int) -> float:
+    return timeit.timeit(func, number=number) / number * 1e6
+
+
+def main():
+    number = 2000
+    for users_count, tasks_count in ((4, 5), (12, 20), (40, 60)):
+        print(f"Room with {users_count} users and {tasks_count} tasks:")
+        print(f"  {'response':<12}     size   dict path   bytes path")
+        for name, (type_, body) in make_responses(users_count, tasks_count).items():
+            assert old_decode(type_, body) == new_decode(type_, body)
+            old = measure(lambda: old_decode(type_, body), number)
+            new = measure(lambda: new_decode(type_, body), number)
+            print(f"  {name:<12} {len(body):>7} B {old:>8.1f} us {new:>9.1f} us")
+
+    print("Task list response:")
+    print("  tasks     per item   envelope")
+    for tasks_count in (5, 20, 60, 200):
+        body = orjson.dumps(
+            {"tasks": [{"id": i, "name": f"Task {i}", "inactive": i % 4 == 0} for i in range(tasks_count)]}
+        )
+        per_item = measure(lambda: [TaskInfo.model_validate(obj) for obj in orjson.loads(body)["tasks"]], number)
+        envelope = measure(lambda: TaskListResponse.model_validate_json(body).tasks, number)
+        print(f"  {tasks_count:>5} {per_item:>8.1f} us {envelope:>7.1f} us")
+
+    body = {
+        "task": CreateTaskBody(
+            name="Take out the trash",
+            description="Every other day",
+            start_date=datetime(2024, 9, 1, 10, 0),
+            period=2,
+            order_id=1,
+        ).model_dump(mode="json"),
+        "user_id": 100000,
+    }
+    print("Request body:")
+    print(f"  json    {measure(lambda: json.dumps(body).encode(), number * 10):>6.2f} us")
+    print(f"  orjson  {measure(lambda: orjson.dumps(body), number * 10):>6.2f} us")
+
+
+if __name__ == "__main__":
+    main()
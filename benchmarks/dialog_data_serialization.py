@@ -0,0 +1,96 @@
+"""
+Compares pickle with DialogDataSerializer on dialog contexts of typical rooms.
+
+Run: python -m benchmarks.dialog_data_serialization
+"""
+
+import os
+import pickle
+import timeit
+from datetime import datetime
+
+for _name in ("BOT_TOKEN", "API_URL", "API_SECRET"):
+    os.environ.setdefault(_name, "benchmark")
+
+from src.api.schemas.method_output_schemas import (  # noqa: E402
+    DailyInfoResponse,
+    RuleInfo,
+    TaskCurrent,
+    TaskDailyInfo,
+    TaskInfo,
+    TaskInfoResponse,
+    UserInfo,
+)
+from src.bot.dialogs.dialog_communications import RoomDialogStartData, TaskViewDialogStartData  # noqa: E402
+from src.bot.serialization import DialogDataSerializer  # noqa: E402
+
+
+def make_contexts(users_count: int, tasks_count: int) -> dict[str, dict]:
+    users = [UserInfo(id=100000 + i, alias=f"user_{i}", fullname=f"User Number {i}") for i in range(users_count)]
+    room = {
+        "start_data": {"input": RoomDialogStartData(1, "Room 101")},
+        "dialog_data": {
+            "room_info": RoomDialogStartData(1, "Room 101"),
+            "daily_info": DailyInfoResponse(
+                periodic_tasks=[
+                    TaskDailyInfo(id=i, name=f"Task {i}", today_executor=users[i % users_count].id)
+                    for i in range(tasks_count)
+                ],
+                manual_tasks=[
+                    TaskDailyInfo(id=i, name=f"Manual {i}", today_executor=users[i % users_count].id)
+                    for i in range(tasks_count // 2)
+                ],
+                user_info={u.id: u for u in users},
+            ),
+            "roommates": users,
+        },
+        "widget_data": {},
+    }
+    task_view = {
+        "start_data": {"intent": "view_task", "input": TaskViewDialogStartData(1)},
+        "dialog_data": {
+            "task_id": 1,
+            "task": TaskInfoResponse(
+                name="Take out the trash",
+                description="Every other day",
+                start_date=datetime(2024, 9, 1, 10, 0),
+                period=2,
+                order_id=1,
+                inactive=False,
+            ),
+            "executors": users,
+            "current_executor": TaskCurrent(number=0, user=users[0]),
+        },
+        "widget_data": {},
+    }
+    lists = {
+        "start_data": None,
+        "dialog_data": {
+            "tasks": [TaskInfo(id=i, name=f"Task {i}", inactive=i % 4 == 0) for i in range(tasks_count)],
+            "rules": [RuleInfo(id=i, name=f"Rule {i}", text="Keep the room clean. " * 10) for i in range(10)],
+        },
+        "widget_data": {},
+    }
+    return {"room": room, "task view": task_view, "lists": lists}
+
+
+def measure(name: str, dumps, loads, data: dict, number: int = 2000) -> None:
+    payload = dumps(data)
+    encode = timeit.timeit(lambda: dumps(data), number=number) / number * 1e6
+    decode = timeit.timeit(lambda: loads(payload), number=number) / number * 1e6
+    print(f"    {name:<8} {len(payload):>7} B {encode:>9.1f} us {decode:>9.1f} us")
+
+
+def main():
+    serializer = DialogDataSerializer()
+    for users_count, tasks_count in ((4, 5), (12, 20), (40, 60)):
+        print(f"Room with {users_count} users and {tasks_count} tasks:")
+        for context_name, context in make_contexts(users_count, tasks_count).items():
+            assert serializer.loads(serializer.dumps(context)) == context
+            print(f"  {context_name:<10}     size    encode    decode")
+            measure("pickle", lambda d: pickle.dumps(d, protocol=pickle.HIGHEST_PROTOCOL), pickle.loads, context)
+            measure("compact", serializer.dumps, serializer.loads, context)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,18 @@
 from src.api.methods import InNoHassleMusicRoomAPI
 from src.bot.config import get_settings
 
-client = InNoHassleMusicRoomAPI(get_settings().API_URL, get_settings().API_SECRET)
+client = InNoHassleMusicRoomAPI(
+    get_settings().API_URL,
+    get_settings().API_SECRET,
+    limit_per_host=get_settings().API_CONNECTION_LIMIT_PER_HOST,
+    keepalive_timeout=get_settings().API_KEEPALIVE_TIMEOUT,
+    dns_cache_ttl=get_settings().API_DNS_CACHE_TTL,
+    cache_size=get_settings().API_CACHE_SIZE,
+    timeout=get_settings().API_TIMEOUT,
+    read_retries=get_settings().API_READ_RETRIES,
+    retry_delay=get_settings().API_RETRY_DELAY,
+    breaker_threshold=get_settings().API_BREAKER_THRESHOLD,
+    breaker_reset_timeout=get_settings().API_BREAKER_RESET_TIMEOUT,
+)
 
 __all__ = ["client", "InNoHassleMusicRoomAPI"]
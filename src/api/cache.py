@@ -0,0 +1,71 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Hashable, Iterable
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    size: int
+    maxsize: int
+
+
+class TTLCache:
+    """
+    A bounded cache that evicts the least recently used entry when full and expires entries after their TTL.
+
+    Every entry may carry tags, ``invalidate`` drops all entries having any of the given tags.
+    """
+
+    maxsize: int
+    hits: int
+    misses: int
+    _entries: OrderedDict[Hashable, tuple[float, frozenset[str], Any]]
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        expires_at, _, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: float, tags: Iterable[str] = ()) -> None:
+        if self.maxsize <= 0:
+            return
+        self._entries[key] = (time.monotonic() + ttl, frozenset(tags), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, *tags: str) -> None:
+        tags = frozenset(tags)
+        for key in [key for key, (_, entry_tags, _) in self._entries.items() if entry_tags & tags]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stats(self) -> CacheStats:
+        return CacheStats(self.hits, self.misses, len(self._entries), self.maxsize)
+
+
+__all__ = ["CacheStats", "TTLCache"]
@@ -0,0 +1,61 @@
+import time
+
+from src.api.exceptions import CircuitOpen
+
+
+class CircuitBreaker:
+    """
+    Stops calls to a failing service, so that callers fail fast instead of waiting for timeouts.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and every call is rejected for
+    ``reset_timeout`` seconds. Then a single probe call is let through: its success closes the circuit, its failure
+    opens it again.
+    """
+
+    failure_threshold: int
+    reset_timeout: float
+    failures: int
+    _opened_at: float | None
+    _probing: bool
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    @property
+    def is_open(self) -> bool:
+        return self._opened_at is not None
+
+    def before_call(self) -> None:
+        """
+        :raises CircuitOpen: if the call must not be made
+        """
+        if self._opened_at is None:
+            return
+        if self._probing or time.monotonic() - self._opened_at < self.reset_timeout:
+            raise CircuitOpen("The backend is unavailable")
+        self._probing = True
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self._probing or self.failures >= self.failure_threshold:
+            self._opened_at = time.monotonic()
+        self._probing = False
+
+    def record_cancel(self) -> None:
+        """
+        Record a call that ended without telling whether the service works, e.g. it has been cancelled. If it was
+        a probe, the next call probes the service instead.
+        """
+        self._probing = False
+
+
+__all__ = ["CircuitBreaker"]
@@ -0,0 +1,52 @@
+class APIError(RuntimeError):
+    """
+    A request to the backend has failed.
+    """
+
+    detail: str
+    status: int | None
+    code: int | None
+
+    def __init__(self, detail: str, status: int | None = None, code: int | None = None):
+        """
+        :param detail: The error description returned by the backend
+        :param status: The HTTP status of the response, ``None`` if there was no response
+        :param code: The backend's error code, if any
+        """
+        super().__init__(detail if code is None else f"{code}. {detail}")
+        self.detail = detail
+        self.status = status
+        self.code = code
+
+
+class NotFound(APIError):
+    """
+    The backend does not provide the requested endpoint (404 or 405), e.g. because it runs an older version.
+    """
+
+
+class Conflict(APIError):
+    """
+    The request contradicts the state of the backend (400 with an error code or 409), e.g. the user has no room.
+    """
+
+
+class Validation(APIError):
+    """
+    The backend rejected the request's data (422).
+    """
+
+
+class Unavailable(APIError):
+    """
+    The backend did not respond in time, could not be reached, or failed with a server error.
+    """
+
+
+class CircuitOpen(Unavailable):
+    """
+    The call was not made because the backend has been failing recently.
+    """
+
+
+__all__ = ["APIError", "CircuitOpen", "Conflict", "NotFound", "Unavailable", "Validation"]
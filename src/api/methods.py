@@ -1,5 +1,13 @@
+import asyncio
+import random
+from typing import Awaitable, Callable, TypeVar
+
 import aiohttp
+import orjson
+from pydantic import TypeAdapter
 
+from src.api.circuit_breaker import CircuitBreaker
+from src.api.exceptions import APIError, CircuitOpen, Conflict, NotFound, Unavailable, Validation
 from src.api.schemas.method_input_schemas import (
     CreateTaskBody,
     ModifyTaskBody,
@@ -8,170 +16,499 @@ from src.api.schemas.method_input_schemas import (
     CreateManualTaskBody,
     ModifyManualTaskBody,
     RemoveManualTaskParametersBody,
+    UserProfileBody,
 )
 from src.api.schemas.method_output_schemas import (
     DailyInfoResponse,
     IncomingInvitationInfo,
+    IncomingInvitationsResponse,
     RoomInfoResponse,
     TaskCurrent,
     TaskCurrentResponse,
     TaskInfoResponse,
     SentInvitationInfo,
+    SentInvitationsResponse,
     TaskInfo,
+    TaskListResponse,
     OrderInfoResponse,
     ListOfOrdersResponse,
     RuleInfo,
     ManualTaskInfo,
+    ManualTaskListResponse,
     ManualTaskInfoResponse,
     ManualTaskCurrentResponse,
 )
+from src.api.cache import CacheStats, TTLCache
+from src.api.single_flight import SingleFlight
+
+# Read endpoints served from the response cache, with their TTLs in seconds.
+_CACHE_TTLS: dict[str, float] = {
+    "/bot/room/info": 60,
+    "/bot/room/list_of_orders": 60,
+    "/bot/order/info": 300,
+    "/bot/task/list": 60,
+    "/bot/manual_task/list": 60,
+    "/bot/rule/list": 300,
+    "/bot/room/daily_info": 30,
+    "/bot/task/info": 60,
+}
+
+_USER_READS = ("/bot/room/info", "/bot/room/list_of_orders", "/bot/order/info", "/bot/room/daily_info")
+_ROOM_READS = tuple(_CACHE_TTLS)
+
+# Cached read endpoints that become stale after a write endpoint is called.
+_INVALIDATIONS: dict[str, tuple[str, ...]] = {
+    "/bot/room/create": _ROOM_READS,
+    "/bot/room/leave": _ROOM_READS,
+    "/bot/invitation/accept": _ROOM_READS,
+    "/bot/user/save_alias": _USER_READS,
+    "/bot/user/save_fullname": _USER_READS,
+    "/bot/user/save_profiles": _USER_READS,
+    "/bot/order/create": ("/bot/room/list_of_orders", "/bot/room/daily_info"),
+    "/bot/order/delete": ("/bot/room/list_of_orders", "/bot/order/info", "/bot/task/info", "/bot/room/daily_info"),
+    "/bot/task/create": ("/bot/task/list", "/bot/room/daily_info"),
+    "/bot/task/modify": ("/bot/task/list", "/bot/task/info", "/bot/room/daily_info"),
+    "/bot/task/remove_parameters": ("/bot/task/list", "/bot/task/info", "/bot/room/daily_info"),
+    "/bot/task/delete": ("/bot/task/list", "/bot/task/info", "/bot/room/daily_info"),
+    "/bot/manual_task/create": ("/bot/manual_task/list", "/bot/room/daily_info"),
+    "/bot/manual_task/modify": ("/bot/manual_task/list", "/bot/room/daily_info"),
+    "/bot/manual_task/remove_parameters": ("/bot/manual_task/list", "/bot/room/daily_info"),
+    "/bot/manual_task/delete": ("/bot/manual_task/list", "/bot/room/daily_info"),
+    "/bot/manual_task/do": ("/bot/room/daily_info",),
+    "/bot/rule/create": ("/bot/rule/list",),
+    "/bot/rule/edit": ("/bot/rule/list",),
+    "/bot/rule/delete": ("/bot/rule/list",),
+}
+
+_MISSING = object()
+
+T = TypeVar("T")
+
+
+def _slice(items: list[T], offset: int, limit: int | None) -> list[T]:
+    # The backend returns lists whole, so pages are cut from the cached response.
+    return items[offset:] if limit is None else items[offset : offset + limit]
+
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+_RULE_LIST_ADAPTER = TypeAdapter(list[RuleInfo])
 
 
 class InNoHassleMusicRoomAPI:
     url: str
     secret: str
-
-    def __init__(self, url: str, secret: str) -> None:
+    limit_per_host: int
+    keepalive_timeout: float
+    dns_cache_ttl: int
+    timeout: float
+    read_retries: int
+    retry_delay: float
+    _session: aiohttp.ClientSession | None
+    _breaker: CircuitBreaker
+    _in_flight: SingleFlight
+    _cache: TTLCache
+    _cache_generation: int
+    _invalidation_listeners: list[Callable[..., None]]
+    _invalidation_publisher: Callable[[tuple[str, ...]], Awaitable[None]] | None
+
+    def __init__(
+        self,
+        url: str,
+        secret: str,
+        limit_per_host: int = 100,
+        keepalive_timeout: float = 30,
+        dns_cache_ttl: int = 300,
+        cache_size: int = 1024,
+        timeout: float = 10,
+        read_retries: int = 2,
+        retry_delay: float = 0.2,
+        breaker_threshold: int = 5,
+        breaker_reset_timeout: float = 30,
+    ) -> None:
+        """
+        :param timeout: Time limit of a single request in seconds
+        :param read_retries: How many times a read is retried if the backend is unavailable
+        :param retry_delay: The base delay between retries in seconds, doubled with every attempt
+        :param breaker_threshold: Consecutive failures after which requests fail fast without reaching the backend
+        :param breaker_reset_timeout: Seconds after which the backend is tried again
+        """
         self.url = url
         self.secret = secret
-
-    async def _post(self, path: str, user_id: int = None, **data: any) -> any:
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+        self.timeout = timeout
+        self.read_retries = read_retries
+        self.retry_delay = retry_delay
+        self._session = None
+        self._breaker = CircuitBreaker(breaker_threshold, breaker_reset_timeout)
+        self._in_flight = SingleFlight()
+        self._cache = TTLCache(cache_size)
+        self._cache_generation = 0
+        self._invalidation_listeners = []
+        self._invalidation_publisher = None
+
+    async def start(self) -> None:
+        """
+        Open the pooled HTTP session. It is reused by every request until ``close`` is called.
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=self.dns_cache_ttl,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers={"X-Token": self.secret},
+            )
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _post(self, path: str, user_id: int = None, **data: any) -> bytes:
+        """
+        :return: The raw JSON body of the response, to be parsed straight into the expected type
+        :raises Unavailable: if the backend does not respond in time, can't be reached, fails with a server error,
+            or has been failing recently (``CircuitOpen``)
+        :raises APIError: if the backend rejects the request, see ``_error`` for the exact types
+        """
         if user_id is not None:
             data["user_id"] = user_id
-        async with aiohttp.ClientSession() as session:
-            r: aiohttp.ClientResponse
-            async with session.post(self.url + path, json=data, headers={"X-Token": self.secret}) as r:
+        body = orjson.dumps(data)
+        if self._session is None or self._session.closed:
+            await self.start()
+        self._breaker.before_call()
+        r: aiohttp.ClientResponse
+        try:
+            async with self._session.post(
+                self.url + path,
+                data=body,
+                headers=_JSON_HEADERS,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            ) as r:
+                if r.status >= 500:
+                    raise Unavailable(await r.text(errors="replace"), r.status)
+                self._breaker.record_success()
                 if r.status != 200:
-                    if r.status in (400, 422):
-                        json = await r.json()
-                        if r.status == 400 and "code" in json:
-                            raise RuntimeError(f"{json['code']}. {json['detail']}")
-                        elif r.status == 422:
-                            raise RuntimeError(json["detail"])
-                    raise RuntimeError(await r.text())
-                return await r.json()
+                    raise self._error(r.status, await r.text(errors="replace"))
+                return await r.read()
+        except Unavailable:
+            self._breaker.record_failure()
+            raise
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self._breaker.record_failure()
+            raise Unavailable(f"{path}: {e!r}") from e
+        except BaseException:
+            # E.g. the call is cancelled. The breaker must not stay waiting for the result of a probe.
+            self._breaker.record_cancel()
+            raise
+
+    @staticmethod
+    def _error(status: int, text: str) -> APIError:
+        """
+        Parse an error response of the backend into the exception of the matching type.
+        """
+        try:
+            body = orjson.loads(text)
+        except orjson.JSONDecodeError:
+            body = None
+        if not isinstance(body, dict):
+            body = {"detail": text}
+        detail = body.get("detail", text)
+        if not isinstance(detail, str):
+            detail = orjson.dumps(detail).decode()
+        code = body.get("code")
+
+        if status in (404, 405):
+            return NotFound(detail, status, code)
+        if status == 409 or (status == 400 and code is not None):
+            return Conflict(detail, status, code)
+        if status == 422:
+            return Validation(detail, status, code)
+        return APIError(detail, status, code)
+
+    async def _post_with_retries(self, path: str, **data: any) -> bytes:
+        """
+        Same as ``_post``, but retried with a jittered exponential backoff while the backend is unavailable.
+        Use only for endpoints without side effects.
+        """
+        for attempt in range(self.read_retries + 1):
+            try:
+                return await self._post(path, **data)
+            except CircuitOpen:
+                raise
+            except Unavailable:
+                if attempt == self.read_retries:
+                    raise
+                await asyncio.sleep(random.uniform(0, self.retry_delay * 2**attempt))
+
+    async def _read(self, path: str, user_id: int = None, **data: any) -> bytes:
+        """
+        Same as ``_post``, but concurrent identical calls (same path and payload) share one backend request,
+        and responses of endpoints listed in ``_CACHE_TTLS`` are cached. Use only for endpoints without side effects.
+        """
+        if user_id is not None:
+            data["user_id"] = user_id
+        key = (path, orjson.dumps(data, option=orjson.OPT_SORT_KEYS).decode())
+        return await self._read_shared(key, path, **data)
+
+    async def _read_shared(self, key: tuple[str, str], path: str, **data: any) -> bytes:
+        """
+        Same as ``_read``, but with an explicit cache key of the path and a scope. Calls that differ only in
+        the user but share the scope (e.g. roommates reading the room) are served by one backend request.
+        """
+        ttl = _CACHE_TTLS.get(path)
+        if ttl is None:
+            return await self._in_flight.do(key, lambda: self._post_with_retries(path, **data))
+
+        cached = self._cache.get(key, _MISSING)
+        if cached is not _MISSING:
+            return cached
+        generation = self._cache_generation
+        # Errors are not cached: e.g. "no room" must end as soon as the user joins one, whichever replica handles it.
+        result = await self._in_flight.do(key, lambda: self._post_with_retries(path, **data))
+        self._store(generation, key, result, ttl, path)
+        return result
+
+    def _store(self, generation: int, key: tuple[str, str], value: any, ttl: float, path: str) -> None:
+        # Do not store a response that may predate a write made while it was in flight.
+        if generation == self._cache_generation:
+            self._cache.set(key, value, ttl, tags=(path,))
+
+    async def _write(self, path: str, user_id: int = None, **data: any) -> any:
+        """
+        Same as ``_post``, but drops cached responses that the call makes stale (see ``_INVALIDATIONS``),
+        and returns the parsed response.
+        """
+        try:
+            return orjson.loads(await self._post(path, user_id, **data))
+        finally:
+            paths = _INVALIDATIONS.get(path, ())
+            self.invalidate(*paths)
+            if paths and self._invalidation_publisher is not None:
+                await self._invalidation_publisher(paths)
+
+    def invalidate(self, *paths: str) -> None:
+        """
+        Drop cached responses of the read endpoints, e.g. after a write made by another bot instance.
+        """
+        if not paths:
+            return
+        self._cache_generation += 1
+        self._cache.invalidate(*paths)
+        self._in_flight.forget(lambda key: key[0] in paths)
+        for listener in self._invalidation_listeners:
+            listener(*paths)
+
+    def add_invalidation_listener(self, listener: Callable[..., None]) -> None:
+        """
+        Call ``listener`` with the paths of read endpoints whenever their cached responses become stale, so that
+        data derived from the responses can be dropped as well.
+        """
+        self._invalidation_listeners.append(listener)
+
+    def set_invalidation_publisher(self, publisher: Callable[[tuple[str, ...]], Awaitable[None]] | None) -> None:
+        """
+        Pass the paths of read endpoints made stale by every write of this client to ``publisher``, so that other
+        bot instances can drop their cached responses as well (see ``invalidate``).
+        """
+        self._invalidation_publisher = publisher
+
+    def clear_cache(self) -> None:
+        self.invalidate(*_CACHE_TTLS)
+
+    @property
+    def cache_stats(self) -> CacheStats:
+        return self._cache.stats
 
     async def create_user(self, user_id: int) -> int:
-        return await self._post("/bot/user/create", user_id)
+        return await self._write("/bot/user/create", user_id)
 
     async def create_room(self, name: str, user_id: int) -> int:
-        return await self._post("/bot/room/create", user_id, room={"name": name})
+        return await self._write("/bot/room/create", user_id, room={"name": name})
 
     async def invite_person(self, alias: str, user_id: int) -> int:
-        return await self._post("/bot/invitation/create", user_id, addressee={"alias": alias})
+        return await self._write("/bot/invitation/create", user_id, addressee={"alias": alias})
+
+    async def invite_people(
+        self, aliases: list[str], user_id: int, concurrency: int = 5
+    ) -> dict[str, int | Conflict | Validation]:
+        """
+        Invite several people at once, sending at most ``concurrency`` requests at a time.
+
+        :return: Mapping of aliases to ids of the created invitations, or to the errors the backend rejected the
+            invitations with
+        :raises APIError: If any invitation failed otherwise, e.g. ``Unavailable``, once all the requests are done
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def invite(alias: str) -> int | Conflict | Validation:
+            async with semaphore:
+                try:
+                    return await self.invite_person(alias, user_id)
+                except (Conflict, Validation) as e:
+                    return e
+
+        results = await asyncio.gather(*(invite(alias) for alias in aliases), return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(result, (Conflict, Validation)):
+                raise result
+        return dict(zip(aliases, results))
 
     async def accept_invitation(self, id_: int, user_id: int) -> int:
-        return await self._post("/bot/invitation/accept", user_id, invitation={"id": id_})
+        return await self._write("/bot/invitation/accept", user_id, invitation={"id": id_})
 
     async def create_order(self, users: list[int], user_id: int) -> int:
-        return await self._post("/bot/order/create", user_id, order={"users": users})
+        return await self._write("/bot/order/create", user_id, order={"users": users})
 
     async def create_task(self, body: CreateTaskBody, user_id: int) -> int:
-        return await self._post("/bot/task/create", user_id, task=body.model_dump(mode="json"))
+        return await self._write("/bot/task/create", user_id, task=body.model_dump(mode="json"))
 
     async def modify_task(self, body: ModifyTaskBody, user_id: int) -> bool:
-        return await self._post("/bot/task/modify", user_id, task=body.model_dump(mode="json"))
+        return await self._write("/bot/task/modify", user_id, task=body.model_dump(mode="json"))
 
     async def remove_task_parameters(self, body: RemoveTaskParametersBody, user_id: int) -> bool:
-        return await self._post("/bot/task/remove_parameters", user_id, task=body.model_dump(mode="json"))
-
-    async def get_daily_info(self, user_id: int) -> DailyInfoResponse:
-        return DailyInfoResponse.model_validate(await self._post("/bot/room/daily_info", user_id))
+        return await self._write("/bot/task/remove_parameters", user_id, task=body.model_dump(mode="json"))
+
+    async def get_daily_info(self, user_id: int, room_id: int | None = None) -> DailyInfoResponse:
+        """
+        :param room_id: The id of the user's room. If given, the response is shared by all roommates
+        """
+        if room_id is None:
+            return DailyInfoResponse.model_validate_json(await self._read("/bot/room/daily_info", user_id))
+        return DailyInfoResponse.model_validate_json(
+            await self._read_shared(
+                ("/bot/room/daily_info", f"room:{room_id}"), "/bot/room/daily_info", user_id=user_id
+            )
+        )
 
     async def get_incoming_invitations(self, user_id: int) -> list[IncomingInvitationInfo]:
-        return [
-            IncomingInvitationInfo.model_validate(obj)
-            for obj in (await self._post("/bot/invitation/inbox", user_id))["invitations"]
-        ]
+        return IncomingInvitationsResponse.model_validate_json(
+            await self._read("/bot/invitation/inbox", user_id)
+        ).invitations
 
     async def get_room_info(self, user_id: int) -> RoomInfoResponse:
-        return RoomInfoResponse.model_validate(await self._post("/bot/room/info", user_id))
+        return RoomInfoResponse.model_validate_json(await self._read("/bot/room/info", user_id))
+
+    async def get_room_info_or_none(self, user_id: int) -> RoomInfoResponse | None:
+        """
+        :return: The user's room, ``None`` if the user has no room
+        """
+        try:
+            return await self.get_room_info(user_id)
+        except Conflict:
+            return None
 
     async def leave_room(self, user_id: int) -> bool:
-        return await self._post("/bot/room/leave", user_id)
+        return await self._write("/bot/room/leave", user_id)
 
-    async def get_tasks(self, user_id: int) -> list[TaskInfo]:
-        return [TaskInfo.model_validate(obj) for obj in (await self._post("/bot/task/list", user_id))["tasks"]]
+    async def get_tasks(self, user_id: int, offset: int = 0, limit: int | None = None) -> list[TaskInfo]:
+        """
+        :param offset: The number of tasks to skip
+        :param limit: The maximum number of tasks to return, all of them by default
+        """
+        tasks = TaskListResponse.model_validate_json(await self._read("/bot/task/list", user_id)).tasks
+        return _slice(tasks, offset, limit)
 
     async def get_task_info(self, id_: int, user_id: int) -> TaskInfoResponse:
-        return TaskInfoResponse.model_validate(await self._post("/bot/task/info", user_id, task={"id": id_}))
+        return TaskInfoResponse.model_validate_json(await self._read("/bot/task/info", user_id, task={"id": id_}))
 
     async def get_sent_invitations(self, user_id: int) -> list[SentInvitationInfo]:
-        return [
-            SentInvitationInfo.model_validate(obj)
-            for obj in (await self._post("/bot/invitation/sent", user_id))["invitations"]
-        ]
+        return SentInvitationsResponse.model_validate_json(
+            await self._read("/bot/invitation/sent", user_id)
+        ).invitations
 
     async def delete_invitation(self, id_: int, user_id: int) -> bool:
-        return await self._post("/bot/invitation/delete", user_id, invitation={"id": id_})
+        return await self._write("/bot/invitation/delete", user_id, invitation={"id": id_})
 
     async def reject_invitation(self, id_: int, user_id: int) -> bool:
-        return await self._post("/bot/invitation/reject", user_id, invitation={"id": id_})
+        return await self._write("/bot/invitation/reject", user_id, invitation={"id": id_})
 
     async def get_order_info(self, id_: int, user_id: int) -> OrderInfoResponse:
-        return OrderInfoResponse.model_validate(await self._post("/bot/order/info", user_id, order={"id": id_}))
+        return OrderInfoResponse.model_validate_json(await self._read("/bot/order/info", user_id, order={"id": id_}))
 
     async def save_user_alias(self, alias: str, user_id: int) -> bool:
-        return await self._post("/bot/user/save_alias", user_id, alias=alias)
+        return await self._write("/bot/user/save_alias", user_id, alias=alias)
 
     async def save_user_fullname(self, fullname: str, user_id: int) -> bool:
-        return await self._post("/bot/user/save_fullname", user_id, fullname=fullname)
+        return await self._write("/bot/user/save_fullname", user_id, fullname=fullname)
+
+    async def save_users_profiles(self, profiles: list[UserProfileBody]) -> bool:
+        """
+        Save aliases and full names of many users at once.
+
+        :raises NotFound: if the backend does not support batched profile updates
+        """
+        return await self._write(
+            "/bot/user/save_profiles", users=[profile.model_dump(mode="json") for profile in profiles]
+        )
 
     async def delete_task(self, task_id: int, user_id: int) -> bool:
-        return await self._post("/bot/task/delete", user_id, task_id=task_id)
+        return await self._write("/bot/task/delete", user_id, task_id=task_id)
 
     async def delete_order(self, order_id: int, user_id: int) -> bool:
-        return await self._post("/bot/order/delete", user_id, order_id=order_id)
+        return await self._write("/bot/order/delete", user_id, order_id=order_id)
 
     async def is_order_in_use(self, order_id: int, user_id: int) -> bool:
-        return await self._post("/bot/order/is_in_use", user_id, order_id=order_id)
+        return orjson.loads(await self._read("/bot/order/is_in_use", user_id, order_id=order_id))
 
     async def list_of_orders(self, user_id: int) -> ListOfOrdersResponse:
-        return ListOfOrdersResponse.model_validate(await self._post("/bot/room/list_of_orders", user_id))
+        return ListOfOrdersResponse.model_validate_json(await self._read("/bot/room/list_of_orders", user_id))
 
     async def create_rule(self, rule: CreateRuleBody, user_id: int) -> int:
-        return await self._post("/bot/rule/create", user_id, rule=rule.model_dump(mode="json"))
+        return await self._write("/bot/rule/create", user_id, rule=rule.model_dump(mode="json"))
 
     async def edit_rule(self, rule_id: int, rule: CreateRuleBody, user_id: int) -> bool:
-        return await self._post("/bot/rule/edit", user_id, rule=rule.model_dump(mode="json"), rule_id=rule_id)
+        return await self._write("/bot/rule/edit", user_id, rule=rule.model_dump(mode="json"), rule_id=rule_id)
 
     async def delete_rule(self, rule_id: int, user_id: int) -> bool:
-        return await self._post("/bot/rule/delete", user_id, rule_id=rule_id)
+        return await self._write("/bot/rule/delete", user_id, rule_id=rule_id)
 
-    async def get_rules(self, user_id: int) -> list[RuleInfo]:
-        return [RuleInfo.model_validate(obj) for obj in (await self._post("/bot/rule/list", user_id))]
+    async def get_rules(self, user_id: int, offset: int = 0, limit: int | None = None) -> list[RuleInfo]:
+        """
+        :param offset: The number of rules to skip
+        :param limit: The maximum number of rules to return, all of them by default
+        """
+        return _slice(_RULE_LIST_ADAPTER.validate_json(await self._read("/bot/rule/list", user_id)), offset, limit)
 
     async def create_manual_task(self, task: CreateManualTaskBody, user_id: int) -> int:
-        return await self._post("/bot/manual_task/create", user_id, task=task.model_dump(mode="json"))
+        return await self._write("/bot/manual_task/create", user_id, task=task.model_dump(mode="json"))
 
     async def modify_manual_task(self, task: ModifyManualTaskBody, user_id: int) -> None:
-        return await self._post("/bot/manual_task/modify", user_id, task=task.model_dump(mode="json"))
+        return await self._write("/bot/manual_task/modify", user_id, task=task.model_dump(mode="json"))
 
     async def remove_manual_task_parameters(self, task: RemoveManualTaskParametersBody, user_id: int) -> None:
-        return await self._post("/bot/manual_task/remove_parameters", user_id, task=task.model_dump(mode="json"))
+        return await self._write("/bot/manual_task/remove_parameters", user_id, task=task.model_dump(mode="json"))
 
-    async def get_manual_tasks(self, user_id: int) -> list[ManualTaskInfo]:
-        return [
-            ManualTaskInfo.model_validate(obj) for obj in (await self._post("/bot/manual_task/list", user_id))["tasks"]
-        ]
+    async def get_manual_tasks(self, user_id: int, offset: int = 0, limit: int | None = None) -> list[ManualTaskInfo]:
+        """
+        :param offset: The number of tasks to skip
+        :param limit: The maximum number of tasks to return, all of them by default
+        """
+        tasks = ManualTaskListResponse.model_validate_json(await self._read("/bot/manual_task/list", user_id)).tasks
+        return _slice(tasks, offset, limit)
 
     async def get_manual_task_info(self, task_id: int, user_id: int) -> ManualTaskInfoResponse:
-        return ManualTaskInfoResponse.model_validate(
-            await self._post("/bot/manual_task/info", user_id, task_id=task_id)
+        return ManualTaskInfoResponse.model_validate_json(
+            await self._read("/bot/manual_task/info", user_id, task_id=task_id)
         )
 
     async def delete_manual_task(self, task_id: int, user_id: int) -> None:
-        return await self._post("/bot/manual_task/delete", user_id, task_id=task_id)
+        return await self._write("/bot/manual_task/delete", user_id, task_id=task_id)
 
     async def do_manual_task(self, task_id: int, user_id: int) -> None:
-        return await self._post("/bot/manual_task/do", user_id, task_id=task_id)
+        return await self._write("/bot/manual_task/do", user_id, task_id=task_id)
 
     async def get_manual_task_current_executor(self, task_id: int, user_id: int) -> TaskCurrent | None:
-        return ManualTaskCurrentResponse.model_validate(
-            await self._post("/bot/manual_task/current_executor", user_id, task_id=task_id)
+        return ManualTaskCurrentResponse.model_validate_json(
+            await self._read("/bot/manual_task/current_executor", user_id, task_id=task_id)
         ).current
 
     async def get_task_current_executor(self, task_id: int, user_id: int) -> TaskCurrent | None:
-        return TaskCurrentResponse.model_validate(
-            await self._post("/bot/task/current_executor", user_id, task_id=task_id)
+        return TaskCurrentResponse.model_validate_json(
+            await self._read("/bot/task/current_executor", user_id, task_id=task_id)
         ).current
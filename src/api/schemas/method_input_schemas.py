@@ -7,6 +7,12 @@ class CreateUserBody(BaseModel):
     user_id: int = Field(ge=0)
 
 
+class UserProfileBody(BaseModel):
+    user_id: int
+    alias: str | None
+    fullname: str | None
+
+
 class CreateRoomBody(BaseModel):
     name: str
 
@@ -96,6 +96,10 @@ class ManualTaskInfo(BaseModel):
     inactive: bool
 
 
+class ManualTaskListResponse(BaseModel):
+    tasks: list[ManualTaskInfo]
+
+
 class ManualTaskInfoResponse(BaseModel):
     name: str
     description: str | None
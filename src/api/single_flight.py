@@ -0,0 +1,43 @@
+import asyncio
+from typing import Awaitable, Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Collapses concurrent calls with the same key into one execution.
+
+    The first caller starts the call, every caller arriving while it is still running awaits the same result.
+    A cancelled waiter does not cancel the shared call for the others.
+    """
+
+    _calls: dict[Hashable, asyncio.Future]
+
+    def __init__(self):
+        self._calls = {}
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        future = self._calls.get(key)
+        if future is None:
+            future = asyncio.ensure_future(func())
+            self._calls[key] = future
+            future.add_done_callback(lambda f: self._done(key, f))
+        return await asyncio.shield(future)
+
+    def forget(self, predicate: Callable[[Hashable], bool]) -> None:
+        """
+        Detach in-flight calls whose key matches the predicate, so that later callers start a new call.
+        """
+        for key in [key for key in self._calls if predicate(key)]:
+            del self._calls[key]
+
+    def _done(self, key: Hashable, future: asyncio.Future) -> None:
+        if self._calls.get(key) is future:
+            del self._calls[key]
+        if not future.cancelled():
+            # Mark the exception as retrieved even if every waiter has gone away.
+            future.exception()
+
+
+__all__ = ["SingleFlight"]
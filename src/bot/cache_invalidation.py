@@ -0,0 +1,85 @@
+import asyncio
+import logging
+import uuid
+
+import orjson
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from src.api import InNoHassleMusicRoomAPI
+
+
+class CacheInvalidationBroadcaster:
+    """
+    Shares invalidations of the API client's cache between bot instances over a Redis channel.
+
+    A write made by one instance drops the responses it makes stale from the caches of all instances, which would
+    otherwise serve them until they expire. Messages published while an instance is disconnected from Redis are lost,
+    so the instance drops its whole cache whenever it (re)subscribes to the channel.
+    """
+
+    redis: Redis
+    api: InNoHassleMusicRoomAPI
+    channel: str
+    retry_delay: float
+    _sender: str
+    _task: asyncio.Task | None
+
+    def __init__(
+        self,
+        redis: Redis,
+        api: InNoHassleMusicRoomAPI,
+        channel: str = "rooms_bot:api_invalidations",
+        retry_delay: float = 1,
+    ):
+        """
+        :param retry_delay: Seconds to wait before subscribing again after the connection is lost
+        """
+        self.redis = redis
+        self.api = api
+        self.channel = channel
+        self.retry_delay = retry_delay
+        # Identifies messages of this instance, whose cache is already up to date.
+        self._sender = uuid.uuid4().hex
+        self._task = None
+
+    async def start(self):
+        if self._task is None:
+            self.api.set_invalidation_publisher(self.publish)
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        self.api.set_invalidation_publisher(None)
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def publish(self, paths: tuple[str, ...]):
+        try:
+            await self.redis.publish(self.channel, orjson.dumps({"sender": self._sender, "paths": paths}))
+        except RedisError as e:
+            # The write itself has succeeded, other instances serve stale responses until they expire.
+            logging.warning("Failed to publish a cache invalidation: %r", e)
+
+    async def _run(self):
+        while True:
+            try:
+                await self._listen()
+            except RedisError as e:
+                logging.warning("Lost the cache invalidation channel: %r", e)
+            await asyncio.sleep(self.retry_delay)
+
+    async def _listen(self):
+        async with self.redis.pubsub() as pubsub:
+            await pubsub.subscribe(self.channel)
+            self.api.clear_cache()
+            async for message in pubsub.listen():
+                if message["type"] != "message":
+                    continue
+                data = orjson.loads(message["data"])
+                if data["sender"] != self._sender:
+                    self.api.invalidate(*data["paths"])
+
+
+__all__ = ["CacheInvalidationBroadcaster"]
@@ -1,4 +1,17 @@
-from .alias_cachers import AliasCacher, MemoryAliasCacher, UserInfo
+from .alias_cachers import AliasCacher, MemoryAliasCacher, RedisAliasCacher, UserInfo
+from .remind_registries import MemoryRemindRegistry, RedisRemindRegistry, RemindRegistry
+from .room_registries import MemoryRoomRegistry, RedisRoomRegistry, RoomRegistry
 
 
-__all__ = ["AliasCacher", "MemoryAliasCacher", "UserInfo"]
+__all__ = [
+    "AliasCacher",
+    "MemoryAliasCacher",
+    "RedisAliasCacher",
+    "UserInfo",
+    "MemoryRemindRegistry",
+    "RedisRemindRegistry",
+    "RemindRegistry",
+    "MemoryRoomRegistry",
+    "RedisRoomRegistry",
+    "RoomRegistry",
+]
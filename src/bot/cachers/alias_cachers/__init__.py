@@ -1,5 +1,6 @@
 from .interface import AliasCacher, UserInfo
 from .memory import MemoryAliasCacher
+from .redis import RedisAliasCacher
 
 
-__all__ = ["AliasCacher", "MemoryAliasCacher", "UserInfo"]
+__all__ = ["AliasCacher", "MemoryAliasCacher", "RedisAliasCacher", "UserInfo"]
@@ -2,27 +2,30 @@ import dataclasses
 from abc import ABC, abstractmethod
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class UserInfo:
     alias: str | None
-    fullname: str
+    fullname: str | None
 
 
 class AliasCacher(ABC):
     @abstractmethod
-    def check(self, user_id: int, info: UserInfo) -> bool:
+    async def check(self, user_id: int, info: UserInfo) -> bool:
         pass
 
     @abstractmethod
-    def get(self, user_id: int) -> UserInfo:
+    async def get(self, user_id: int) -> UserInfo | None:
         pass
 
+    async def get_many(self, user_ids: list[int]) -> dict[int, UserInfo | None]:
+        return {user_id: await self.get(user_id) for user_id in user_ids}
+
     @abstractmethod
-    def set(self, user_id: int, info: UserInfo):
+    async def set(self, user_id: int, info: UserInfo):
         pass
 
     @abstractmethod
-    def delete(self, user_id: int):
+    async def delete(self, user_id: int):
         pass
 
 
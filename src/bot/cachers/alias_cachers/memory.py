@@ -1,22 +1,49 @@
+from collections import OrderedDict
+
 from .interface import AliasCacher, UserInfo
 
 
 class MemoryAliasCacher(AliasCacher):
-    _aliases: dict[int, UserInfo]
-
-    def __init__(self):
-        self._aliases = {}
-
-    def check(self, user_id: int, info: UserInfo) -> bool:
-        return self.get(user_id) == info
-
-    def get(self, user_id: int) -> UserInfo:
-        return self._aliases.get(user_id, None)
-
-    def set(self, user_id: int, info: UserInfo):
-        self._aliases[user_id] = info
-
-    def delete(self, user_id: int):
+    """
+    Keeps user info in the process memory.
+
+    When ``capacity`` is set, the least recently used entries are evicted, so memory usage stays flat
+    regardless of how many users have ever written to the bot.
+    """
+
+    capacity: int | None
+    evictions: int
+    _aliases: OrderedDict[int, tuple[str | None, str | None]]
+
+    def __init__(self, capacity: int | None = None):
+        self.capacity = capacity
+        self.evictions = 0
+        # Entries are packed into tuples, which are much smaller than dataclass instances.
+        self._aliases = OrderedDict()
+
+    @property
+    def size(self) -> int:
+        return len(self._aliases)
+
+    async def check(self, user_id: int, info: UserInfo) -> bool:
+        return await self.get(user_id) == info
+
+    async def get(self, user_id: int) -> UserInfo | None:
+        entry = self._aliases.get(user_id, None)
+        if entry is None:
+            return None
+        self._aliases.move_to_end(user_id)
+        return UserInfo(*entry)
+
+    async def set(self, user_id: int, info: UserInfo):
+        self._aliases[user_id] = (info.alias, info.fullname)
+        self._aliases.move_to_end(user_id)
+        if self.capacity is not None:
+            while len(self._aliases) > self.capacity:
+                self._aliases.popitem(last=False)
+                self.evictions += 1
+
+    async def delete(self, user_id: int):
         if user_id in self._aliases:
             del self._aliases[user_id]
 
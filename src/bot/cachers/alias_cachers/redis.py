@@ -0,0 +1,55 @@
+import json
+
+from redis.asyncio import Redis
+
+from .interface import AliasCacher, UserInfo
+
+
+class RedisAliasCacher(AliasCacher):
+    """
+    Keeps user info in Redis, so that it survives restarts and is shared by all bot instances.
+    """
+
+    _redis: Redis
+    _prefix: str
+    _ttl: int | None
+
+    def __init__(self, redis: Redis, prefix: str = "rooms_bot:alias", ttl: int | None = None):
+        """
+        :param redis: A Redis connection
+        :param prefix: A prefix of the keys
+        :param ttl: Expiration time of an entry in seconds, ``None`` to keep entries forever
+        """
+        self._redis = redis
+        self._prefix = prefix
+        self._ttl = ttl
+
+    def _key(self, user_id: int) -> str:
+        return f"{self._prefix}:{user_id}"
+
+    async def check(self, user_id: int, info: UserInfo) -> bool:
+        return await self.get(user_id) == info
+
+    async def get(self, user_id: int) -> UserInfo | None:
+        return self._parse(await self._redis.get(self._key(user_id)))
+
+    async def get_many(self, user_ids: list[int]) -> dict[int, UserInfo | None]:
+        # One round trip for all users.
+        values = await self._redis.mget([self._key(user_id) for user_id in user_ids]) if user_ids else []
+        return {user_id: self._parse(value) for user_id, value in zip(user_ids, values)}
+
+    @staticmethod
+    def _parse(value: bytes | None) -> UserInfo | None:
+        if value is None:
+            return None
+        alias, fullname = json.loads(value)
+        return UserInfo(alias, fullname)
+
+    async def set(self, user_id: int, info: UserInfo):
+        await self._redis.set(self._key(user_id), json.dumps([info.alias, info.fullname]), ex=self._ttl)
+
+    async def delete(self, user_id: int):
+        await self._redis.delete(self._key(user_id))
+
+
+__all__ = ["RedisAliasCacher"]
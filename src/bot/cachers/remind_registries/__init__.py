@@ -0,0 +1,6 @@
+from .interface import RemindRegistry
+from .memory import MemoryRemindRegistry
+from .redis import RedisRemindRegistry
+
+
+__all__ = ["MemoryRemindRegistry", "RedisRemindRegistry", "RemindRegistry"]
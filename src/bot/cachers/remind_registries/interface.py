@@ -0,0 +1,24 @@
+from abc import ABC, abstractmethod
+
+
+class RemindRegistry(ABC):
+    """
+    Remembers when reminders were sent, so that an executor is not reminded about the same duty over and over.
+    """
+
+    @abstractmethod
+    async def try_remind(self, key: str, cooldown: int) -> float | None:
+        """
+        Record a reminder unless one with the same key has been recorded within the last ``cooldown`` seconds.
+
+        :return: ``None`` if the reminder is recorded, otherwise seconds since the previous reminder
+        """
+
+    @abstractmethod
+    async def forget(self, key: str):
+        """
+        Drop the record, e.g. if the reminder has failed to be sent.
+        """
+
+
+__all__ = ["RemindRegistry"]
@@ -0,0 +1,34 @@
+import time
+
+from .interface import RemindRegistry
+
+
+class MemoryRemindRegistry(RemindRegistry):
+    """
+    Keeps reminder times in the process memory.
+    """
+
+    _reminded_at: dict[str, tuple[float, float]]
+
+    def __init__(self):
+        # Keys are mapped to the time of the reminder and the time the record expires at.
+        self._reminded_at = {}
+
+    async def try_remind(self, key: str, cooldown: int) -> float | None:
+        now = time.time()
+        entry = self._reminded_at.get(key)
+        if entry is not None and entry[1] > now:
+            return now - entry[0]
+        self._prune(now)
+        self._reminded_at[key] = (now, now + cooldown)
+        return None
+
+    async def forget(self, key: str):
+        self._reminded_at.pop(key, None)
+
+    def _prune(self, now: float):
+        for key in [key for key, (_, expires_at) in self._reminded_at.items() if expires_at <= now]:
+            del self._reminded_at[key]
+
+
+__all__ = ["MemoryRemindRegistry"]
@@ -0,0 +1,42 @@
+import time
+
+from redis.asyncio import Redis
+
+from .interface import RemindRegistry
+
+
+class RedisRemindRegistry(RemindRegistry):
+    """
+    Keeps reminder times in Redis keys expiring after the cooldown, so that all bot instances share them.
+    """
+
+    _redis: Redis
+    _prefix: str
+
+    def __init__(self, redis: Redis, prefix: str = "rooms_bot:remind"):
+        """
+        :param redis: A Redis connection
+        :param prefix: A prefix of the keys
+        """
+        self._redis = redis
+        self._prefix = prefix
+
+    def _key(self, key: str) -> str:
+        return f"{self._prefix}:{key}"
+
+    async def try_remind(self, key: str, cooldown: int) -> float | None:
+        now = time.time()
+        # Only one of concurrent reminders succeeds in setting the key.
+        if await self._redis.set(self._key(key), str(now), nx=True, ex=cooldown):
+            return None
+        reminded_at = await self._redis.get(self._key(key))
+        if reminded_at is None:
+            # Expired right now.
+            return await self.try_remind(key, cooldown)
+        return now - float(reminded_at)
+
+    async def forget(self, key: str):
+        await self._redis.delete(self._key(key))
+
+
+__all__ = ["RedisRemindRegistry"]
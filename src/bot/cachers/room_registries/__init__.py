@@ -0,0 +1,6 @@
+from .interface import RoomRegistry
+from .memory import MemoryRoomRegistry
+from .redis import RedisRoomRegistry
+
+
+__all__ = ["MemoryRoomRegistry", "RedisRoomRegistry", "RoomRegistry"]
@@ -0,0 +1,44 @@
+from abc import ABC, abstractmethod
+from datetime import date
+
+
+class RoomRegistry(ABC):
+    """
+    Remembers the rooms known to the bot, a member of each room to query the backend with, and the last day
+    the room was notified about duties.
+    """
+
+    @abstractmethod
+    async def add(self, room_id: int, user_id: int):
+        pass
+
+    @abstractmethod
+    async def remove(self, room_id: int, user_id: int):
+        """
+        Forget the room if the user is the member it is queried with.
+        """
+
+    @abstractmethod
+    async def rooms(self) -> dict[int, int]:
+        """
+        :return: Mapping of room ids to ids of their members
+        """
+
+    @abstractmethod
+    async def get_last_sent(self, room_id: int) -> date | None:
+        pass
+
+    async def get_last_sent_many(self, room_ids: list[int]) -> dict[int, date | None]:
+        return {room_id: await self.get_last_sent(room_id) for room_id in room_ids}
+
+    @abstractmethod
+    async def claim(self, room_id: int, day: date) -> bool:
+        """
+        Mark the room as notified on the day unless it already is. Of concurrent calls, possibly made by several bot
+        instances, only one succeeds.
+
+        :return: Whether the room has been claimed by this call and should be notified
+        """
+
+
+__all__ = ["RoomRegistry"]
@@ -0,0 +1,40 @@
+from datetime import date
+
+from .interface import RoomRegistry
+
+
+class MemoryRoomRegistry(RoomRegistry):
+    """
+    Keeps rooms in the process memory. Rooms are forgotten on restart, and are notified again if the bot restarts
+    during the notification window.
+    """
+
+    _rooms: dict[int, int]
+    _last_sent: dict[int, date]
+
+    def __init__(self):
+        self._rooms = {}
+        self._last_sent = {}
+
+    async def add(self, room_id: int, user_id: int):
+        self._rooms[room_id] = user_id
+
+    async def remove(self, room_id: int, user_id: int):
+        if self._rooms.get(room_id) == user_id:
+            del self._rooms[room_id]
+            self._last_sent.pop(room_id, None)
+
+    async def rooms(self) -> dict[int, int]:
+        return dict(self._rooms)
+
+    async def get_last_sent(self, room_id: int) -> date | None:
+        return self._last_sent.get(room_id)
+
+    async def claim(self, room_id: int, day: date) -> bool:
+        if self._last_sent.get(room_id) == day:
+            return False
+        self._last_sent[room_id] = day
+        return True
+
+
+__all__ = ["MemoryRoomRegistry"]
@@ -0,0 +1,67 @@
+from datetime import date
+
+from redis.asyncio import Redis
+
+from .interface import RoomRegistry
+
+
+class RedisRoomRegistry(RoomRegistry):
+    """
+    Keeps rooms and the last sent markers in Redis hashes, so that they survive restarts and are shared by all bot
+    instances. Rooms are claimed with separate keys, set only if absent, that expire after ``claim_ttl`` seconds.
+    """
+
+    _redis: Redis
+    _prefix: str
+    _rooms_key: str
+    _last_sent_key: str
+    _claim_ttl: int
+
+    def __init__(self, redis: Redis, prefix: str = "rooms_bot:duty", claim_ttl: int = 2 * 24 * 60 * 60):
+        """
+        :param redis: A Redis connection
+        :param prefix: A prefix of the keys
+        :param claim_ttl: Expiration time of a claim in seconds, it must outlast the day it is made for
+        """
+        self._redis = redis
+        self._prefix = prefix
+        self._rooms_key = f"{prefix}:rooms"
+        self._last_sent_key = f"{prefix}:last_sent"
+        self._claim_ttl = claim_ttl
+
+    async def add(self, room_id: int, user_id: int):
+        await self._redis.hset(self._rooms_key, str(room_id), str(user_id))
+
+    async def remove(self, room_id: int, user_id: int):
+        if await self._redis.hget(self._rooms_key, str(room_id)) == str(user_id).encode():
+            await self._redis.hdel(self._rooms_key, str(room_id))
+            await self._redis.hdel(self._last_sent_key, str(room_id))
+
+    async def rooms(self) -> dict[int, int]:
+        return {int(room_id): int(user_id) for room_id, user_id in (await self._redis.hgetall(self._rooms_key)).items()}
+
+    async def get_last_sent(self, room_id: int) -> date | None:
+        return self._parse(await self._redis.hget(self._last_sent_key, str(room_id)))
+
+    async def get_last_sent_many(self, room_ids: list[int]) -> dict[int, date | None]:
+        # One round trip for all rooms.
+        values = (
+            await self._redis.hmget(self._last_sent_key, [str(room_id) for room_id in room_ids]) if room_ids else []
+        )
+        return {room_id: self._parse(value) for room_id, value in zip(room_ids, values)}
+
+    @staticmethod
+    def _parse(value: bytes | None) -> date | None:
+        return date.fromisoformat(value.decode()) if value is not None else None
+
+    async def claim(self, room_id: int, day: date) -> bool:
+        if not await self._redis.set(
+            f"{self._prefix}:claim:{room_id}:{day.isoformat()}", 1, nx=True, ex=self._claim_ttl
+        ):
+            return False
+        # The marker lets instances skip claimed rooms with a single read.
+        await self._redis.hset(self._last_sent_key, str(room_id), day.isoformat())
+        return True
+
+
+__all__ = ["RedisRoomRegistry"]
@@ -1,18 +1,87 @@
+import re
+from datetime import time
 from functools import lru_cache
+from typing import Literal
 
 import dotenv
+from pydantic import model_validator
 from pydantic_settings import BaseSettings
 
+# Characters that Telegram allows in the secret token of a webhook.
+_WEBHOOK_SECRET_PATTERN = re.compile(r"[A-Za-z0-9_-]{1,256}")
+
 
 class Settings(BaseSettings):
     BOT_TOKEN: str
     API_URL: str
     API_SECRET: str
     TELEGRAM_PROXY_URL: str | None = None
+    API_CONNECTION_LIMIT_PER_HOST: int = 100
+    API_KEEPALIVE_TIMEOUT: float = 30
+    API_DNS_CACHE_TTL: int = 300
+    API_CACHE_SIZE: int = 1024
+    API_TIMEOUT: float = 10
+    API_READ_RETRIES: int = 2
+    API_RETRY_DELAY: float = 0.2
+    API_BREAKER_THRESHOLD: int = 5
+    API_BREAKER_RESET_TIMEOUT: float = 30
+    API_CACHE_INVALIDATION: Literal["local", "redis"] = "local"
+    REDIS_URL: str | None = None
+    ALIAS_CACHER: Literal["memory", "redis"] = "memory"
+    FSM_STORAGE: Literal["memory", "redis"] = "memory"
+    FSM_TTL: int | None = None
+    ALIAS_CACHE_TTL: int | None = None
+    ALIAS_CACHE_CAPACITY: int | None = 100_000
+    USER_SYNC_MODE: Literal["blocking", "background"] = "blocking"
+    USER_SYNC_FLUSH_INTERVAL: float = 1
+    # Updates are received with a webhook if its public base URL is set, otherwise with long polling.
+    WEBHOOK_URL: str | None = None
+    WEBHOOK_PATH: str = "/webhook"
+    # Required with a webhook: updates without it are rejected, otherwise anyone could post updates from any user.
+    WEBHOOK_SECRET: str | None = None
+    WEBHOOK_HOST: str = "0.0.0.0"
+    WEBHOOK_PORT: int = 80
+    # If turned on, executors are notified about their duties once a day, at a moment within the window that depends
+    # on the room.
+    DUTY_NOTIFICATIONS: bool = False
+    DUTY_REGISTRY: Literal["memory", "redis"] = "memory"
+    DUTY_TIMEZONE: str = "Europe/Moscow"
+    DUTY_WINDOW_START: time = time(8)
+    DUTY_WINDOW_END: time = time(11)
+    # Executors of periodic tasks are requested from the backend, or computed by the bot from the task and its order.
+    # Computing them is opt-in until it is checked against answers recorded from the backend, see
+    # tests/record_rotation_answers.py. The schedule of a room is only computed locally, so it is shown only then.
+    ROTATION_SOURCE: Literal["local", "backend"] = "backend"
+    # An executor is reminded about a task at most once per the cooldown, in seconds.
+    REMIND_COOLDOWN: int = 15 * 60
+    REMIND_REGISTRY: Literal["memory", "redis"] = "memory"
+    # Limits of outgoing messages, in messages per second.
+    SEND_GLOBAL_RATE: float = 30
+    SEND_CHAT_RATE: float = 1
+    # Handlers wait for their replies to be sent for at most this number of seconds.
+    SEND_REPLY_TIMEOUT: float = 3
 
     def __init__(self):
         super().__init__(_env_file=None)
 
+    @model_validator(mode="after")
+    def check_required_settings(self) -> "Settings":
+        if self.ALIAS_CACHER == "redis" and self.REDIS_URL is None:
+            raise ValueError("REDIS_URL is required to use the Redis alias cacher")
+        if self.FSM_STORAGE == "redis" and self.REDIS_URL is None:
+            raise ValueError("REDIS_URL is required to use the Redis FSM storage")
+        if self.DUTY_REGISTRY == "redis" and self.REDIS_URL is None:
+            raise ValueError("REDIS_URL is required to use the Redis room registry")
+        if self.REMIND_REGISTRY == "redis" and self.REDIS_URL is None:
+            raise ValueError("REDIS_URL is required to use the Redis remind registry")
+        if self.API_CACHE_INVALIDATION == "redis" and self.REDIS_URL is None:
+            raise ValueError("REDIS_URL is required to share cache invalidations")
+        if self.WEBHOOK_URL is not None and self.WEBHOOK_SECRET is None:
+            raise ValueError("WEBHOOK_SECRET is required to receive updates with a webhook")
+        if self.WEBHOOK_SECRET is not None and not _WEBHOOK_SECRET_PATTERN.fullmatch(self.WEBHOOK_SECRET):
+            raise ValueError("WEBHOOK_SECRET must be 1-256 characters A-Z, a-z, 0-9, _ and -")
+        return self
+
 
 @lru_cache
 def get_settings():
@@ -7,10 +7,12 @@ from aiogram_dialog.widgets.kbd import Row, Cancel, ListGroup, Button, SwitchTo
 from aiogram_dialog.widgets.text import Const, Format, List, Case
 
 from src.api import client
+from src.api.exceptions import Conflict
 from src.api.schemas.method_output_schemas import SentInvitationInfo
 from src.bot.dialogs.dialog_communications import ConfirmationDialogStartData
 from src.bot.dialogs.states import OutgoingInvitationsSG, ConfirmationSG
 from src.bot.utils import list_group_finder
+from src.bot.send_queue import send_queue
 
 
 class InvitationsWindowConsts:
@@ -25,10 +27,18 @@ class InvitationsWindowConsts:
 
 
 class InviteWindowConsts:
-    ENTER_ALIAS_PROMPT = "Enter a user's alias"
+    ENTER_ALIAS_PROMPT = "Enter users' aliases, separated by commas or new lines"
     ALIAS_PATTERN = re.compile(r"@?[a-z][a-z0-9_]{4,31}")
+    ALIAS_SEPARATOR_PATTERN = re.compile(r"[,\n]")
     INCORRECT_ALIAS_MESSAGE = "The entered alias is incorrect. Try again."
+    INCORRECT_ALIASES_MESSAGE = "These aliases are incorrect: {}. Try again."
     INVITATION_SENT_MESSAGE = "The invitation has been sent"
+    INVITATION_RESULT_FORMAT = "@{}: {}"
+    INVITATION_SENT_RESULT = "sent"
+    # E.g. the user has not started the bot, or is already invited or in the room.
+    INVITATION_CONFLICT_RESULT = "can't be invited"
+    INVITATION_INVALID_RESULT = "incorrect alias"
+    MAX_CONCURRENT_INVITATIONS = 5
 
     CANCEL_BUTTON_ID = "cancel_button"
     ENTER_ALIAS_INPUT_ID = "enter_alias_input"
@@ -64,16 +74,41 @@ class Events:
         )
 
     @staticmethod
-    async def on_enter_alias(message: Message, widget, manager: DialogManager, alias: str):
-        alias = alias.strip()
-        if not InviteWindowConsts.ALIAS_PATTERN.fullmatch(alias.lower()):
-            await message.answer(InviteWindowConsts.INCORRECT_ALIAS_MESSAGE)
+    def invitation_result(result: int | Exception) -> str:
+        # Details of the backend's errors are not meant for users.
+        if isinstance(result, Conflict):
+            return InviteWindowConsts.INVITATION_CONFLICT_RESULT
+        if isinstance(result, Exception):
+            return InviteWindowConsts.INVITATION_INVALID_RESULT
+        return InviteWindowConsts.INVITATION_SENT_RESULT
+
+    @staticmethod
+    async def on_enter_alias(message: Message, widget, manager: DialogManager, text: str):
+        aliases = [alias.strip() for alias in InviteWindowConsts.ALIAS_SEPARATOR_PATTERN.split(text)]
+        aliases = [alias for alias in aliases if alias]
+        incorrect = [alias for alias in aliases if not InviteWindowConsts.ALIAS_PATTERN.fullmatch(alias.lower())]
+        if not aliases or (incorrect and len(aliases) == 1):
+            await send_queue.send_message(message.bot, message.chat.id, InviteWindowConsts.INCORRECT_ALIAS_MESSAGE)
+            return
+        if incorrect:
+            await send_queue.send_message(
+                message.bot, message.chat.id, InviteWindowConsts.INCORRECT_ALIASES_MESSAGE.format(", ".join(incorrect))
+            )
             return
 
-        if alias[0] == "@":
-            alias = alias[1:]
-        await client.invite_person(alias, manager.event.from_user.id)
-        await message.bot.send_message(message.chat.id, InviteWindowConsts.INVITATION_SENT_MESSAGE)
+        # Remove "@" and repeated aliases, keeping the order.
+        aliases = list(dict.fromkeys(alias.removeprefix("@") for alias in aliases))
+        results = await client.invite_people(
+            aliases, manager.event.from_user.id, concurrency=InviteWindowConsts.MAX_CONCURRENT_INVITATIONS
+        )
+        if len(results) == 1 and not isinstance(next(iter(results.values())), Exception):
+            summary = InviteWindowConsts.INVITATION_SENT_MESSAGE
+        else:
+            summary = "\n".join(
+                InviteWindowConsts.INVITATION_RESULT_FORMAT.format(alias, Events.invitation_result(result))
+                for alias, result in results.items()
+            )
+        await send_queue.send_message(message.bot, message.chat.id, summary)
         await Loader.load_invitations(manager)
         await manager.switch_to(OutgoingInvitationsSG.list, show_mode=ShowMode.SEND)
 
@@ -1,3 +1,4 @@
+import asyncio
 import re
 from dataclasses import dataclass
 
@@ -21,6 +22,7 @@ from src.bot.dialogs.dialog_communications import (
     CreateOrderStartData,
 )
 from src.bot.dialogs.states import ManualTaskViewSG, ConfirmationSG, PromptSG, CreateOrderSG
+from src.bot.utils import remind_executor
 
 
 class MainWindowConsts:
@@ -59,7 +61,13 @@ class Loader:
         user_id = manager.event.from_user.id
         task_id = manager.dialog_data["task_id"]
 
-        task_data: ManualTaskInfoResponse = await client.get_manual_task_info(task_id, user_id)
+        # The current executor is requested by the task's id only, so it is fetched together with the task.
+        task_data: ManualTaskInfoResponse
+        current: TaskCurrent | None
+        task_data, current = await asyncio.gather(
+            client.get_manual_task_info(task_id, user_id),
+            client.get_manual_task_current_executor(task_id, user_id),
+        )
         manager.dialog_data["task"] = task_data
 
         if task_data.order_id is None:
@@ -68,9 +76,27 @@ class Loader:
         else:
             order_data: OrderInfoResponse = await client.get_order_info(task_data.order_id, user_id)
             manager.dialog_data["executors"] = order_data.users
-            current: TaskCurrent | None = await client.get_manual_task_current_executor(task_id, user_id)
             manager.dialog_data["current_executor"] = current
 
+    @staticmethod
+    def patch_task(manager: DialogManager, **changes):
+        """
+        Apply a successful modification to the task kept in the dialog data instead of fetching the task again.
+        """
+        manager.dialog_data["task"] = manager.dialog_data["task"].model_copy(update=changes)
+
+    @staticmethod
+    async def load_current_executor(manager: DialogManager):
+        """
+        Update the current executor after the task has been done, the order being the same.
+        """
+        task: ManualTaskInfoResponse = manager.dialog_data["task"]
+        if task.order_id is None:
+            return
+        manager.dialog_data["current_executor"] = await client.get_manual_task_current_executor(
+            manager.dialog_data["task_id"], manager.event.from_user.id
+        )
+
 
 class Events:
     @staticmethod
@@ -141,7 +167,7 @@ class Events:
             case "edit_name":
                 if result is not None:
                     await client.modify_manual_task(ModifyManualTaskBody(id=task_id, name=result), user_id)
-                    await Loader.load_task_info(manager)
+                    Loader.patch_task(manager, name=result)
                 await manager.show(ShowMode.SEND)
             case "edit_description":
                 if result is not None:
@@ -151,7 +177,7 @@ class Events:
                         )
                     else:
                         await client.modify_manual_task(ModifyManualTaskBody(id=task_id, description=result), user_id)
-                    await Loader.load_task_info(manager)
+                    Loader.patch_task(manager, description=result or None)
                 await manager.show(ShowMode.SEND)
             case "edit_order":
                 if not result[0]:
@@ -174,7 +200,7 @@ class Events:
         task_id = manager.dialog_data["task_id"]
         user_id = callback.from_user.id
         await client.do_manual_task(task_id, user_id)
-        await Loader.load_task_info(manager)
+        await Loader.load_current_executor(manager)
         await manager.show()
 
     @staticmethod
@@ -183,9 +209,8 @@ class Events:
         if current_executor is None:
             return
         task: ManualTaskInfoResponse = manager.dialog_data["task"]
-        await callback.bot.send_message(
-            current_executor.user.id, f'{callback.from_user.full_name} reminds you about your duty in "{task.name}"'
-        )
+        task_id: int = manager.dialog_data["task_id"]
+        await remind_executor(callback, manager, f"manual:{task_id}", task.name, current_executor.user)
 
 
 async def getter(dialog_manager: DialogManager, **kwargs):
@@ -2,7 +2,7 @@ from dataclasses import dataclass, asdict
 
 from aiogram.types import CallbackQuery
 from aiogram_dialog import DialogManager, Window, Dialog, ShowMode
-from aiogram_dialog.widgets.kbd import Button, Group, Select, Cancel
+from aiogram_dialog.widgets.kbd import Button, Group, Select, Cancel, StubScroll, Row, PrevPage, CurrentPage, NextPage
 from aiogram_dialog.widgets.text import Const, Format
 
 from src.api import client
@@ -10,7 +10,8 @@ from src.api.schemas.method_input_schemas import CreateManualTaskBody
 from src.api.schemas.method_output_schemas import ManualTaskInfo
 from src.bot.dialogs.dialog_communications import CreateManualTaskForm, TaskViewDialogStartData, CreateTaskStartData
 from src.bot.dialogs.states import ManualTasksSG, CreateManualTaskSG, ManualTaskViewSG
-from src.bot.utils import select_finder
+from src.bot.utils import select_finder, get_page, reset_pages
+from src.bot.send_queue import send_queue
 
 
 class TasksWindowConsts:
@@ -22,6 +23,9 @@ class TasksWindowConsts:
     BACK_BUTTON_ID = "back_button"
     NEW_TASK_BUTTON_ID = "new_task_button"
     TASK_SELECT_ID = "task_select"
+    TASK_SCROLL_ID = "task_scroll"
+
+    PAGE_SIZE = 10
 
 
 @dataclass
@@ -33,16 +37,22 @@ class TaskRepresentation:
 
 class Loader:
     @staticmethod
-    async def load_tasks(manager: DialogManager):
-        data: list[ManualTaskInfo] = await client.get_manual_tasks(manager.event.from_user.id)
-        manager.dialog_data["tasks"] = data
-
+    async def load_page(manager: DialogManager) -> tuple[list[ManualTaskInfo], int]:
+        user_id = manager.event.from_user.id
+        return await get_page(
+            manager,
+            "tasks",
+            TasksWindowConsts.TASK_SCROLL_ID,
+            TasksWindowConsts.PAGE_SIZE,
+            lambda offset, limit: client.get_manual_tasks(user_id, offset, limit),
+        )
 
-class Events:
     @staticmethod
-    async def on_start(start_data, manager: DialogManager):
-        await Loader.load_tasks(manager)
+    def reload_tasks(manager: DialogManager):
+        reset_pages(manager, "tasks")
 
+
+class Events:
     @staticmethod
     @select_finder("tasks")
     async def on_select_task(callback: CallbackQuery, widget, manager: DialogManager, task: ManualTaskInfo):
@@ -71,15 +81,16 @@ class Events:
                 return
             form: CreateManualTaskForm = result[1]
             await client.create_manual_task(CreateManualTaskBody(**asdict(form)), manager.event.from_user.id)
-            await manager.event.bot.send_message(manager.event.message.chat.id, "Created")
+            await send_queue.send_message(manager.event.bot, manager.event.message.chat.id, "Created")
             # no update is required because on_process_result happens before the dialog is re-rendered
 
-        await Loader.load_tasks(manager)
+        Loader.reload_tasks(manager)
 
 
 # noinspection DuplicatedCode
 async def list_getter(dialog_manager: DialogManager, **kwargs):
-    task_data: list[ManualTaskInfo] = dialog_manager.dialog_data.get("tasks", [])
+    task_data: list[ManualTaskInfo]
+    task_data, pages = await Loader.load_page(dialog_manager)
     tasks = [
         TaskRepresentation(
             t.id,
@@ -90,6 +101,7 @@ async def list_getter(dialog_manager: DialogManager, **kwargs):
     ]
     return {
         "tasks": tasks,
+        "pages": pages,
     }
 
 
@@ -112,6 +124,13 @@ manual_tasks_dialog = Dialog(
             ),
             width=2,
         ),
+        StubScroll(id=TasksWindowConsts.TASK_SCROLL_ID, pages="pages"),
+        Row(
+            PrevPage(scroll=TasksWindowConsts.TASK_SCROLL_ID),
+            CurrentPage(scroll=TasksWindowConsts.TASK_SCROLL_ID),
+            NextPage(scroll=TasksWindowConsts.TASK_SCROLL_ID),
+            when=lambda data, w, m: data["pages"] > 1,
+        ),
         Cancel(
             Const("◀️ Back"),
             TasksWindowConsts.BACK_BUTTON_ID,
@@ -119,6 +138,5 @@ manual_tasks_dialog = Dialog(
         state=ManualTasksSG.list,
         getter=list_getter,
     ),
-    on_start=Events.on_start,
     on_process_result=Events.on_process_result,
 )
@@ -7,6 +7,7 @@ from src.api import client
 from src.bot.cachers import UserInfo
 from src.bot.dialogs.dialog_communications import CreateOrderStartData
 from src.bot.dialogs.states import CreateOrderSG
+from src.bot.send_queue import send_queue
 
 
 class CreateOrderConsts:
@@ -33,7 +34,7 @@ class Events:
 
     @staticmethod
     async def on_cancel(callback: CallbackQuery, widget, manager: DialogManager):
-        await callback.bot.send_message(callback.message.chat.id, "Canceled")
+        await send_queue.send_message(callback.bot, callback.message.chat.id, "Canceled")
         await manager.done((False, None), show_mode=ShowMode.NO_UPDATE)
 
     @staticmethod
@@ -46,7 +47,7 @@ class Events:
 
     @staticmethod
     async def on_select_none(callback: CallbackQuery, widget, manager: DialogManager):
-        await callback.bot.send_message(callback.message.chat.id, "No order was selected")
+        await send_queue.send_message(callback.bot, callback.message.chat.id, "No order was selected")
         await manager.done((True, None), show_mode=ShowMode.NO_UPDATE)
 
     @staticmethod
@@ -7,7 +7,7 @@ from src.bot.dialogs.dialog_communications import (
     CreateTaskStartData,
 )
 from src.bot.dialogs.states import PromptSG, CreatePeriodicTaskSG, CreateOrderSG
-from src.bot.utils import datetime_validator, parse_datetime
+from src.bot.utils import datetime_validator, parse_datetime, positive_int_validator
 
 
 class Events:
@@ -70,7 +70,7 @@ class Events:
                 form.start_date = parse_datetime(result)
                 await Events._prompt_step(
                     "enter_period",
-                    PromptDialogStartData("a period in days", filter=lambda s: s.isdecimal() and int(s) > 0),
+                    PromptDialogStartData("a period in days", filter=positive_int_validator),
                     manager,
                 )
             case "enter_period":
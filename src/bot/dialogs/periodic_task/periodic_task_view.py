@@ -1,3 +1,4 @@
+import asyncio
 import re
 from dataclasses import dataclass
 from datetime import datetime
@@ -17,7 +18,9 @@ from src.bot.dialogs.dialog_communications import (
     CreateOrderStartData,
 )
 from src.bot.dialogs.states import PeriodicTaskViewSG, ConfirmationSG, PromptSG, CreateOrderSG
-from src.bot.utils import parse_datetime, datetime_validator
+from src.bot.config import get_settings
+from src.bot.rotation import current_executor
+from src.bot.utils import parse_datetime, datetime_validator, remind_executor
 
 
 class MainWindowConsts:
@@ -66,7 +69,17 @@ class Loader:
         user_id = manager.event.from_user.id
         task_id = manager.dialog_data["task_id"]
 
-        task_data: TaskInfoResponse = await client.get_task_info(task_id, user_id)
+        if get_settings().ROTATION_SOURCE == "backend":
+            # The current executor is requested by the task's id only, so it is fetched together with the task.
+            task_data: TaskInfoResponse
+            current: TaskCurrent | None
+            task_data, current = await asyncio.gather(
+                client.get_task_info(task_id, user_id),
+                client.get_task_current_executor(task_id, user_id),
+            )
+        else:
+            task_data = await client.get_task_info(task_id, user_id)
+            current = None
         manager.dialog_data["task"] = task_data
 
         if task_data.order_id is None:
@@ -75,9 +88,31 @@ class Loader:
         else:
             order_data = await client.get_order_info(task_data.order_id, user_id)
             manager.dialog_data["executors"] = order_data.users
-            current: TaskCurrent | None = await client.get_task_current_executor(task_id, user_id)
+            if get_settings().ROTATION_SOURCE != "backend":
+                current = current_executor(task_data, order_data.users)
             manager.dialog_data["current_executor"] = current
 
+    @staticmethod
+    def patch_task(manager: DialogManager, **changes):
+        """
+        Apply a successful modification to the task kept in the dialog data instead of fetching the task again.
+        """
+        manager.dialog_data["task"] = manager.dialog_data["task"].model_copy(update=changes)
+
+    @staticmethod
+    async def load_current_executor(manager: DialogManager):
+        """
+        Update the current executor after the schedule of the task has changed, the order being the same.
+        """
+        task: TaskInfoResponse = manager.dialog_data["task"]
+        if task.order_id is None:
+            return
+        if get_settings().ROTATION_SOURCE == "backend":
+            current = await client.get_task_current_executor(manager.dialog_data["task_id"], manager.event.from_user.id)
+        else:
+            current = current_executor(task, manager.dialog_data["executors"])
+        manager.dialog_data["current_executor"] = current
+
 
 class Events:
     @staticmethod
@@ -162,7 +197,7 @@ class Events:
             case "edit_name":
                 if result is not None:
                     await client.modify_task(ModifyTaskBody(id=task_id, name=result), user_id)
-                    await Loader.load_task_info(manager)
+                    Loader.patch_task(manager, name=result)
                 await manager.show(ShowMode.SEND)
             case "edit_description":
                 if result is not None:
@@ -172,17 +207,20 @@ class Events:
                         )
                     else:
                         await client.modify_task(ModifyTaskBody(id=task_id, description=result), user_id)
-                    await Loader.load_task_info(manager)
+                    Loader.patch_task(manager, description=result or None)
                 await manager.show(ShowMode.SEND)
             case "edit_start_date":
                 if result is not None:
-                    await client.modify_task(ModifyTaskBody(id=task_id, start_date=parse_datetime(result)), user_id)
-                    await Loader.load_task_info(manager)
+                    start_date = parse_datetime(result)
+                    await client.modify_task(ModifyTaskBody(id=task_id, start_date=start_date), user_id)
+                    Loader.patch_task(manager, start_date=start_date)
+                    await Loader.load_current_executor(manager)
                 await manager.show(ShowMode.SEND)
             case "edit_period":
                 if result is not None:
                     await client.modify_task(ModifyTaskBody(id=task_id, period=result), user_id)
-                    await Loader.load_task_info(manager)
+                    Loader.patch_task(manager, period=int(result))
+                    await Loader.load_current_executor(manager)
                 await manager.show(ShowMode.SEND)
             case "edit_order":
                 if not result[0]:
@@ -204,9 +242,8 @@ class Events:
         if current_executor is None:
             return
         task: TaskInfoResponse = manager.dialog_data["task"]
-        await callback.bot.send_message(
-            current_executor.user.id, f'{callback.from_user.full_name} reminds you about your duty in "{task.name}"'
-        )
+        task_id: int = manager.dialog_data["task_id"]
+        await remind_executor(callback, manager, f"periodic:{task_id}", task.name, current_executor.user)
 
 
 async def getter(dialog_manager: DialogManager, **kwargs):
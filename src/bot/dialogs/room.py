@@ -1,4 +1,6 @@
+from datetime import datetime
 from typing import Awaitable, Callable, Any
+from zoneinfo import ZoneInfo
 
 from aiogram.types import CallbackQuery
 from aiogram_dialog import Dialog, Window, DialogManager, ShowMode, StartMode
@@ -7,6 +9,8 @@ from aiogram_dialog.widgets.text import Format, Const, List
 
 from src.api import client
 from src.api.schemas.method_output_schemas import DailyInfoResponse, UserInfo
+from src.bot.cachers import RoomRegistry
+from src.bot.config import get_settings
 from src.bot.dialogs.dialog_communications import (
     RoomDialogStartData,
     ConfirmationDialogStartData,
@@ -22,10 +26,12 @@ from src.bot.dialogs.states import (
     PeriodicTasksSG,
     ManualTasksSG,
 )
+from src.bot.schedule import get_room_schedule
 
 
 class MainWindowConsts:
     REFRESH_BUTTON_ID = "refresh_button"
+    SCHEDULE_BUTTON_ID = "schedule_button"
     ROOMMATES_BUTTON_ID = "roommates_button"
     TASKS_BUTTON_ID = "tasks_button"
     RULES_BUTTON_ID = "rules_button"
@@ -38,6 +44,13 @@ class RoommatesWindowConsts:
     BACK_BUTTON_ID = "back_button"
 
 
+class ScheduleWindowConsts:
+    DAYS = 14
+    DAY_FORMAT = "%a %d.%m"
+    NO_DUTIES_TEXT = "no duties"
+    BACK_BUTTON_ID = "back_button"
+
+
 class TaskCategoriesWindowConsts:
     PERIODIC_TASKS_BUTTON_ID = "periodic_tasks_button"
     MANUAL_TASKS_BUTTON_ID = "manual_tasks_button"
@@ -49,6 +62,9 @@ class Events:
     async def on_start(start_data: dict, manager: DialogManager):
         args: RoomDialogStartData = start_data["input"]
         manager.dialog_data["room_info"] = args
+        room_registry: RoomRegistry | None = manager.middleware_data.get("room_registry")
+        if room_registry is not None:
+            await room_registry.add(args.id, manager.event.from_user.id)
         await Loader.load_daily_info(manager)
 
     @staticmethod
@@ -77,6 +93,9 @@ class Events:
 
             user_id = manager.event.from_user.id
             await client.leave_room(user_id)
+            room_registry: RoomRegistry | None = manager.middleware_data.get("room_registry")
+            if room_registry is not None:
+                await room_registry.remove(manager.dialog_data["room_info"].id, user_id)
             await manager.start(
                 RoomlessSG.welcome,
                 mode=StartMode.RESET_STACK,
@@ -110,7 +129,8 @@ class Loader:
 
     @staticmethod
     async def load_daily_info(manager: DialogManager):
-        data = await client.get_daily_info(manager.event.from_user.id)
+        room_info: RoomDialogStartData = manager.dialog_data["room_info"]
+        data = await client.get_daily_info(manager.event.from_user.id, room_info.id)
         manager.dialog_data["daily_info"] = data
 
     @staticmethod
@@ -139,6 +159,22 @@ async def getter(dialog_manager: DialogManager, **kwargs):
     }
 
 
+async def schedule_getter(dialog_manager: DialogManager, **kwargs):
+    room_info: RoomDialogStartData = dialog_manager.dialog_data["room_info"]
+    now = datetime.now(ZoneInfo(get_settings().DUTY_TIMEZONE))
+    schedule = await get_room_schedule(room_info.id, dialog_manager.event.from_user.id, now, ScheduleWindowConsts.DAYS)
+    return {
+        "days": [
+            (
+                day.day.strftime(ScheduleWindowConsts.DAY_FORMAT),
+                ", ".join(f"{name}: {executor.fullname}" for name, executor in day.duties)
+                or ScheduleWindowConsts.NO_DUTIES_TEXT,
+            )
+            for day in schedule
+        ],
+    }
+
+
 room_dialog = Dialog(
     # Main page
     Window(
@@ -158,6 +194,13 @@ room_dialog = Dialog(
                 MainWindowConsts.REFRESH_BUTTON_ID,
                 on_click=Loader.show_decorator(Loader.load_callback(Loader.load_daily_info)),
             ),
+            # The schedule is computed locally and could disagree with executors requested from the backend.
+            SwitchTo(
+                Const("Schedule"),
+                MainWindowConsts.SCHEDULE_BUTTON_ID,
+                RoomSG.schedule,
+                when=lambda data, w, m: get_settings().ROTATION_SOURCE == "local",
+            ),
         ),
         Row(
             SwitchTo(
@@ -215,6 +258,22 @@ room_dialog = Dialog(
         state=RoomSG.roommates,
         getter=getter,
     ),
+    # Schedule of periodic tasks
+    Window(
+        Format(f"Duties for the next {ScheduleWindowConsts.DAYS} days:"),
+        List(
+            Format("{item[0]} - {item[1]}"),
+            items="days",
+        ),
+        SwitchTo(
+            Const("◀️ Back"),
+            ScheduleWindowConsts.BACK_BUTTON_ID,
+            RoomSG.main,
+            on_click=Loader.load_callback(Loader.load_daily_info),
+        ),
+        state=RoomSG.schedule,
+        getter=schedule_getter,
+    ),
     # Task category selection
     Window(
         Const("Choose a category:"),
@@ -2,6 +2,7 @@ from aiogram_dialog import ShowMode, DialogManager, Dialog, Window
 
 from src.bot.dialogs.dialog_communications import PromptDialogStartData, CreateRuleForm
 from src.bot.dialogs.states import PromptSG, CreateRuleSG
+from src.bot.send_queue import send_queue
 
 
 class Events:
@@ -47,7 +48,7 @@ class Events:
                     await Events._cancel(manager)
                     return
                 form.text = result
-                await manager.event.bot.send_message(manager.event.chat.id, "Created")
+                await send_queue.send_message(manager.event.bot, manager.event.chat.id, "Created")
                 await manager.done((True, form), ShowMode.SEND)
 
 
@@ -1,6 +1,17 @@
 from aiogram.types import CallbackQuery
 from aiogram_dialog import Dialog, Window, DialogManager, ShowMode
-from aiogram_dialog.widgets.kbd import SwitchTo, Button, Group, Select, Cancel
+from aiogram_dialog.widgets.kbd import (
+    SwitchTo,
+    Button,
+    Group,
+    Select,
+    Cancel,
+    StubScroll,
+    Row,
+    PrevPage,
+    CurrentPage,
+    NextPage,
+)
 from aiogram_dialog.widgets.text import Format, Const, Jinja
 
 from src.api import client
@@ -8,7 +19,7 @@ from src.api.schemas.method_input_schemas import CreateRuleBody
 from src.api.schemas.method_output_schemas import RuleInfo
 from src.bot.dialogs.dialog_communications import CreateRuleForm, ConfirmationDialogStartData
 from src.bot.dialogs.states import RulesSG, CreateRuleSG, ConfirmationSG
-from src.bot.utils import select_finder
+from src.bot.utils import select_finder, get_page, reset_pages
 
 
 class RulesWindowConsts:
@@ -21,20 +32,29 @@ class RulesWindowConsts:
     NEW_RULE_BUTTON_ID = "new_rule_button"
     RULE_SELECT_ID = "rule_select"
     DELETE_RULE_BUTTON_ID = "delete_button"
+    RULE_SCROLL_ID = "rule_scroll"
+
+    PAGE_SIZE = 10
 
 
 class Loader:
     @staticmethod
-    async def load_rules(manager: DialogManager):
-        data = await client.get_rules(manager.event.from_user.id)
-        manager.dialog_data["rules"] = data
-
+    async def load_page(manager: DialogManager) -> tuple[list[RuleInfo], int]:
+        user_id = manager.event.from_user.id
+        return await get_page(
+            manager,
+            "rules",
+            RulesWindowConsts.RULE_SCROLL_ID,
+            RulesWindowConsts.PAGE_SIZE,
+            lambda offset, limit: client.get_rules(user_id, offset, limit),
+        )
 
-class Events:
     @staticmethod
-    async def on_start(start_data: dict, manager: DialogManager):
-        await Loader.load_rules(manager)
+    def reload_rules(manager: DialogManager):
+        reset_pages(manager, "rules")
+
 
+class Events:
     @staticmethod
     @select_finder("rules")
     async def on_select_rule(callback: CallbackQuery, widget, manager: DialogManager, rule: RuleInfo):
@@ -73,14 +93,14 @@ class Events:
 
             form: CreateRuleForm = result[1]
             await client.create_rule(CreateRuleBody(name=form.name, text=form.text), manager.event.from_user.id)
-            await Loader.load_rules(manager)
+            Loader.reload_rules(manager)
             # no update is required because on_process happens before the dialog is re-rendered
         elif start_data["intent"] == "delete_rule":
             if result:
                 user_id = manager.event.from_user.id
                 rule: RuleInfo = manager.dialog_data["current_rule"]
                 await client.delete_rule(rule.id, user_id)
-                await Loader.load_rules(manager)
+                Loader.reload_rules(manager)
                 # Here aiogram-dialog only changes an internal state variable.
                 # To redraw (send) message, an explicit show() is required.
                 await manager.switch_to(RulesSG.list)
@@ -90,9 +110,11 @@ class Events:
 
 
 async def list_getter(dialog_manager: DialogManager, **kwargs):
-    rules: list[RuleInfo] = dialog_manager.dialog_data["rules"]
+    rules: list[RuleInfo]
+    rules, pages = await Loader.load_page(dialog_manager)
     return {
         "rules": rules,
+        "pages": pages,
     }
 
 
@@ -117,6 +139,13 @@ rules_dialog = Dialog(
             ),
             width=2,
         ),
+        StubScroll(id=RulesWindowConsts.RULE_SCROLL_ID, pages="pages"),
+        Row(
+            PrevPage(scroll=RulesWindowConsts.RULE_SCROLL_ID),
+            CurrentPage(scroll=RulesWindowConsts.RULE_SCROLL_ID),
+            NextPage(scroll=RulesWindowConsts.RULE_SCROLL_ID),
+            when=lambda data, w, m: data["pages"] > 1,
+        ),
         Button(
             Const(RulesWindowConsts.NEW_RULE_BUTTON_TEXT),
             id=RulesWindowConsts.NEW_RULE_BUTTON_ID,
@@ -146,6 +175,5 @@ rules_dialog = Dialog(
         state=RulesSG.view,
         getter=view_getter,
     ),
-    on_start=Events.on_start,
     on_process_result=Events.on_process_result,
 )
@@ -15,6 +15,7 @@ class RoomSG(StatesGroup):
     invitations = State()
     tasks = State()
     rules = State()
+    schedule = State()
 
 
 class IncomingInvitationsSG(StatesGroup):
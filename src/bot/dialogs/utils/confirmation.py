@@ -5,6 +5,7 @@ from aiogram_dialog.widgets.text import Format
 
 from src.bot.dialogs.dialog_communications import ConfirmationDialogStartData
 from src.bot.dialogs.states import ConfirmationSG
+from src.bot.send_queue import send_queue
 
 
 async def on_start(start_data: dict, manager: DialogManager):
@@ -24,7 +25,7 @@ async def on_select(callback: CallbackQuery, widget, manager: DialogManager, ite
     confirmed = item_id == confirmation.yes_button
     answer = confirmation.yes_message if confirmed else confirmation.no_message
     if answer is not None:
-        await callback.bot.send_message(callback.message.chat.id, answer)
+        await send_queue.send_message(callback.bot, callback.message.chat.id, answer)
     await manager.done(confirmed, show_mode=ShowMode.NO_UPDATE)
 
 
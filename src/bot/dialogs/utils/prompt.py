@@ -6,6 +6,7 @@ from aiogram_dialog.widgets.text import Format
 
 from src.bot.dialogs.dialog_communications import PromptDialogStartData
 from src.bot.dialogs.states import PromptSG
+from src.bot.send_queue import send_queue
 
 
 class Events:
@@ -16,13 +17,15 @@ class Events:
 
     @staticmethod
     async def on_cancel(callback: CallbackQuery, widget, manager: DialogManager):
-        await callback.bot.send_message(callback.message.chat.id, manager.dialog_data["args"].cancel_message)
+        await send_queue.send_message(
+            callback.bot, callback.message.chat.id, manager.dialog_data["args"].cancel_message
+        )
         await manager.done(None, show_mode=ShowMode.NO_UPDATE)
 
     @staticmethod
     async def on_input(message: Message, widget, manager: DialogManager, text: str):
         if not manager.dialog_data["args"].validate(text):
-            await message.bot.send_message(message.chat.id, "Input is invalid. Try again.")
+            await send_queue.send_message(message.bot, message.chat.id, "Input is invalid. Try again.")
             return
         await manager.done(text, show_mode=ShowMode.NO_UPDATE)
 
@@ -0,0 +1,135 @@
+import asyncio
+import logging
+import zlib
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta, tzinfo
+
+from aiogram import Bot
+from aiogram.exceptions import TelegramAPIError
+
+from src.api import client
+from src.api.exceptions import Conflict
+from src.api.schemas.method_output_schemas import DailyInfoResponse
+from src.bot.cachers import RoomRegistry
+from src.bot.send_queue import Priority, send_queue
+
+
+class DutyNotifier:
+    """
+    Sends every executor the list of their duties once a day.
+
+    Each room gets its own moment within the daily window, derived from the room id, so the load is spread over
+    the window instead of peaking at its start. Due rooms are processed in batches of ``batch_size``. Messages go
+    through the send queue with the broadcast priority, so they never delay replies to users. An executor gets
+    a single message per room.
+
+    A room is claimed in the registry right before its messages are sent, and is skipped by every instance that
+    fails to claim it. So neither a restart nor several replicas sharing the registry notify a room twice a day.
+    If the bot stops between claiming a room and sending its messages, the room misses that day's notification.
+    """
+
+    bot: Bot
+    registry: RoomRegistry
+    timezone: tzinfo
+    window_start: time
+    window_end: time
+    batch_size: int
+    check_interval: float
+    _task: asyncio.Task | None
+
+    def __init__(
+        self,
+        bot: Bot,
+        registry: RoomRegistry,
+        timezone: tzinfo,
+        window_start: time,
+        window_end: time,
+        batch_size: int = 20,
+        check_interval: float = 60,
+    ):
+        self.bot = bot
+        self.registry = registry
+        self.timezone = timezone
+        self.window_start = window_start
+        self.window_end = window_end
+        self.batch_size = batch_size
+        self.check_interval = check_interval
+        self._task = None
+
+    async def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self):
+        while True:
+            try:
+                await self.notify_due_rooms()
+            except Exception:
+                logging.exception("Failed to notify rooms about duties")
+            await asyncio.sleep(self.check_interval)
+
+    def slot(self, room_id: int, day: date) -> datetime:
+        """
+        The moment of the day when the room is notified.
+        """
+        start = datetime.combine(day, self.window_start, self.timezone)
+        end = datetime.combine(day, self.window_end, self.timezone)
+        span = max(int((end - start).total_seconds()), 1)
+        return start + timedelta(seconds=zlib.crc32(str(room_id).encode()) % span)
+
+    async def notify_due_rooms(self):
+        now = datetime.now(self.timezone)
+        today = now.date()
+        if now >= datetime.combine(today, self.window_end, self.timezone):
+            # Rooms missed today (e.g. while the bot was down) wait for tomorrow.
+            return
+
+        rooms = await self.registry.rooms()
+        started = [room_id for room_id in rooms if self.slot(room_id, today) <= now]
+        last_sent = await self.registry.get_last_sent_many(started)
+        due = [room_id for room_id in started if last_sent[room_id] != today]
+
+        for start in range(0, len(due), self.batch_size):
+            batch = due[start : start + self.batch_size]
+            # The member may have moved to another room, so the response is not shared with the room's cache.
+            infos = await asyncio.gather(
+                *(client.get_daily_info(rooms[room_id]) for room_id in batch), return_exceptions=True
+            )
+            messages = []
+            for room_id, info in zip(batch, infos):
+                if isinstance(info, Exception):
+                    logging.warning("Failed to get daily info of room %d: %r", room_id, info)
+                    if isinstance(info, Conflict):
+                        # The member is likely not in the room anymore, it is registered again once opened.
+                        await self.registry.remove(room_id, rooms[room_id])
+                    continue
+                # Another instance may be notifying the same room.
+                if await self.registry.claim(room_id, today):
+                    messages.extend(self._messages(info).items())
+            await asyncio.gather(*(self._send(user_id, text) for user_id, text in messages))
+
+    @staticmethod
+    def _messages(info: DailyInfoResponse) -> dict[int, str]:
+        duties: dict[int, list[str]] = defaultdict(list)
+        for task in [*info.periodic_tasks, *info.manual_tasks]:
+            duties[task.today_executor].append(task.name)
+        return {
+            user_id: "Your duties for today:\n" + "\n".join(f"• {name}" for name in names)
+            for user_id, names in duties.items()
+        }
+
+    async def _send(self, chat_id: int, text: str):
+        try:
+            await send_queue.send_message(self.bot, chat_id, text, priority=Priority.BROADCAST)
+        except TelegramAPIError as e:
+            # E.g. the user has blocked the bot.
+            logging.warning("Failed to notify user %d about duties: %r", chat_id, e)
+
+
+__all__ = ["DutyNotifier"]
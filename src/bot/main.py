@@ -1,18 +1,92 @@
 import asyncio
 import logging
+from zoneinfo import ZoneInfo
 
 from aiogram import Bot, Dispatcher, F
+from aiogram.webhook.aiohttp_server import SimpleRequestHandler, setup_application
+from aiohttp import web
 from aiogram.client.session.aiohttp import AiohttpSession
 from aiogram.filters import CommandStart, ExceptionTypeFilter
+from aiogram.fsm.storage.base import BaseStorage
+from aiogram.fsm.storage.memory import MemoryStorage
 from aiogram.types import ErrorEvent, CallbackQuery
 from aiogram_dialog import setup_dialogs
 from aiogram_dialog.api.exceptions import UnknownIntent
+from redis.asyncio import Redis
 
-from src.bot.cachers import MemoryAliasCacher
+from src.api import client
+from src.api.exceptions import Unavailable
+from src.bot.cache_invalidation import CacheInvalidationBroadcaster
+from src.bot.cachers import (
+    AliasCacher,
+    MemoryAliasCacher,
+    RedisAliasCacher,
+    RoomRegistry,
+    MemoryRoomRegistry,
+    RedisRoomRegistry,
+    RemindRegistry,
+    MemoryRemindRegistry,
+    RedisRemindRegistry,
+)
 from src.bot.config import get_settings
 from src.bot.dialogs import dialogs
+from src.bot.duty_notifier import DutyNotifier
 from src.bot.middleware import UpdateUserInfoMiddleware
+from src.bot.send_queue import send_queue
 from src.bot.start_message import start_message_handler
+from src.bot.storage import DialogRedisStorage
+from src.bot.user_sync import UserSyncWorker
+
+
+def create_alias_cacher(redis: Redis | None) -> AliasCacher:
+    if get_settings().ALIAS_CACHER == "redis":
+        return RedisAliasCacher(redis, ttl=get_settings().ALIAS_CACHE_TTL)
+    return MemoryAliasCacher(capacity=get_settings().ALIAS_CACHE_CAPACITY)
+
+
+def create_room_registry(redis: Redis | None) -> RoomRegistry:
+    if get_settings().DUTY_REGISTRY == "redis":
+        return RedisRoomRegistry(redis)
+    return MemoryRoomRegistry()
+
+
+def create_remind_registry(redis: Redis | None) -> RemindRegistry:
+    if get_settings().REMIND_REGISTRY == "redis":
+        return RedisRemindRegistry(redis)
+    return MemoryRemindRegistry()
+
+
+def create_fsm_storage(redis: Redis | None) -> BaseStorage:
+    if get_settings().FSM_STORAGE == "redis":
+        return DialogRedisStorage(redis, state_ttl=get_settings().FSM_TTL, data_ttl=get_settings().FSM_TTL)
+    return MemoryStorage()
+
+
+async def run_webhook(dp: Dispatcher, bot: Bot):
+    settings = get_settings()
+
+    async def set_webhook():
+        await bot.set_webhook(
+            settings.WEBHOOK_URL + settings.WEBHOOK_PATH,
+            secret_token=settings.WEBHOOK_SECRET,
+            allowed_updates=dp.resolve_used_update_types(),
+        )
+
+    dp.startup.register(set_webhook)
+
+    app = web.Application()
+    SimpleRequestHandler(dp, bot, secret_token=settings.WEBHOOK_SECRET).register(app, path=settings.WEBHOOK_PATH)
+    setup_application(app, dp, bot=bot)
+
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, settings.WEBHOOK_HOST, settings.WEBHOOK_PORT)
+    await site.start()
+    logging.info("Listening for webhook updates on %s:%d", settings.WEBHOOK_HOST, settings.WEBHOOK_PORT)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await runner.cleanup()
 
 
 async def main():
@@ -24,9 +98,51 @@ async def main():
     else:
         session = None
 
+    redis = Redis.from_url(get_settings().REDIS_URL) if get_settings().REDIS_URL else None
+
     bot = Bot(token=get_settings().BOT_TOKEN, session=session)
-    dp = Dispatcher()
-    dp.message.middleware(UpdateUserInfoMiddleware(MemoryAliasCacher()))
+    storage = create_fsm_storage(redis)
+    events_isolation = storage.create_isolation() if isinstance(storage, DialogRedisStorage) else None
+    dp = Dispatcher(storage=storage, events_isolation=events_isolation)
+    dp.startup.register(client.start)
+    if get_settings().API_CACHE_INVALIDATION == "redis":
+        invalidation_broadcaster = CacheInvalidationBroadcaster(redis, client)
+        dp.startup.register(invalidation_broadcaster.start)
+        dp.shutdown.register(invalidation_broadcaster.stop)
+    dp.startup.register(send_queue.start)
+
+    alias_cacher = create_alias_cacher(redis)
+    if get_settings().USER_SYNC_MODE == "background":
+        sync_worker = UserSyncWorker(alias_cacher, flush_interval=get_settings().USER_SYNC_FLUSH_INTERVAL)
+        dp.startup.register(sync_worker.start)
+        dp.shutdown.register(sync_worker.stop)
+    else:
+        sync_worker = None
+    user_info_middleware = UpdateUserInfoMiddleware(alias_cacher, sync_worker)
+    dp.message.middleware(user_info_middleware)
+    dp.callback_query.middleware(user_info_middleware)
+
+    room_registry = create_room_registry(redis)
+    # Available to handlers and dialogs as keyword arguments of the same names.
+    dp["room_registry"] = room_registry
+    dp["remind_registry"] = create_remind_registry(redis)
+    if get_settings().DUTY_NOTIFICATIONS:
+        duty_notifier = DutyNotifier(
+            bot,
+            room_registry,
+            timezone=ZoneInfo(get_settings().DUTY_TIMEZONE),
+            window_start=get_settings().DUTY_WINDOW_START,
+            window_end=get_settings().DUTY_WINDOW_END,
+        )
+        dp.startup.register(duty_notifier.start)
+        dp.shutdown.register(duty_notifier.stop)
+
+    # Shutdown handlers run in the order of registration, the connections must outlive the workers.
+    dp.shutdown.register(send_queue.stop)
+    dp.shutdown.register(client.close)
+    if redis is not None:
+        dp.shutdown.register(redis.aclose)
+
     dp.message.register(start_message_handler, CommandStart())
     dp.include_routers(*dialogs)
 
@@ -34,8 +150,21 @@ async def main():
     async def unknown_intent_handler(event: ErrorEvent, callback_query: CallbackQuery):
         await callback_query.answer("Use /start command to restart.")
 
-    setup_dialogs(dp)
-    await dp.start_polling(bot)
+    @dp.error(ExceptionTypeFilter(Unavailable))
+    async def backend_unavailable_handler(event: ErrorEvent):
+        logging.warning("Backend is unavailable: %r", event.exception)
+        text = "The service is temporarily unavailable. Please try again in a minute."
+        if event.update.callback_query is not None:
+            await event.update.callback_query.answer(text, show_alert=True)
+        elif event.update.message is not None:
+            await send_queue.send_message(bot, event.update.message.chat.id, text)
+
+    setup_dialogs(dp, events_isolation=events_isolation)
+    if get_settings().WEBHOOK_URL:
+        await run_webhook(dp, bot)
+    else:
+        await bot.delete_webhook()
+        await dp.start_polling(bot)
 
 
 if __name__ == "__main__":
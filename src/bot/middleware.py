@@ -1,40 +1,64 @@
 from typing import Callable, Any, Dict, Awaitable
 
 from aiogram import BaseMiddleware
-from aiogram.types import Message
+from aiogram.types import TelegramObject, User
 
 from src.api import client
+from src.api.exceptions import APIError, Unavailable
 from src.bot.cachers import AliasCacher, UserInfo
+from src.bot.user_sync import UserSyncWorker, sync_user_info
 
 
 class UpdateUserInfoMiddleware(BaseMiddleware):
     cache: AliasCacher
+    sync_worker: UserSyncWorker | None
 
-    def __init__(self, cache: AliasCacher):
+    def __init__(self, cache: AliasCacher, sync_worker: UserSyncWorker | None = None):
+        """
+        :param cache: A cache of users' info known by the backend
+        :param sync_worker: If given, users' info is synced in the background instead of before the handler runs
+        """
         self.cache = cache
+        self.sync_worker = sync_worker
 
     async def __call__(
-        self, handler: Callable[[Message, Dict[str, Any]], Awaitable[Any]], message: Message, data: Dict[str, Any]
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any],
     ) -> Any:
-        user = message.from_user
+        user: User | None = data.get("event_from_user")
+        if user is None:
+            return await handler(event, data)
+
+        info = UserInfo(user.username, user.full_name)
+        # A single lookup per update, the cache may be remote.
+        cached = await self.cache.get(user.id)
 
         # If the user is not registered, register them.
-        if self.cache.get(user.id) is None:
+        # Handlers' requests require the user to exist, so this is never deferred.
+        if cached is None:
             try:
                 await client.create_user(user.id)
-            except RuntimeError:
+            except Unavailable:
+                raise
+            except APIError:
+                # Most likely already registered. The status the backend answers with is not documented, so any
+                # rejection is ignored, as before errors were typed. An unavailable backend still fails the update.
                 pass
+            if self.sync_worker is not None:
+                # Remember the registration until the worker caches the actual info.
+                cached = UserInfo(None, None)
+                await self.cache.set(user.id, cached)
 
         # Update information about the user's alias.
-        if not self.cache.check(user.id, UserInfo(user.username, user.full_name)):
-            cached = self.cache.get(user.id)
-            if cached is None or user.username != cached.alias:
-                await client.save_user_alias(user.username, user.id)
-            if cached is None or user.full_name != cached.fullname:
-                await client.save_user_fullname(user.full_name, user.id)
-            self.cache.set(user.id, UserInfo(user.username, user.full_name))
-
-        return await handler(message, data)
+        if cached != info:
+            if self.sync_worker is None:
+                await sync_user_info(self.cache, user.id, info, cached)
+            else:
+                self.sync_worker.submit(user.id, info)
+
+        return await handler(event, data)
 
 
 __all__ = ["UpdateUserInfoMiddleware"]
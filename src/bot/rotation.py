@@ -0,0 +1,55 @@
+from datetime import datetime, timedelta
+from typing import Iterator
+
+from src.api.schemas.method_output_schemas import TaskCurrent, TaskInfoResponse, UserInfo
+
+
+def executor_number(task: TaskInfoResponse, executors_count: int, at: datetime) -> int | None:
+    """
+    The position in the order of the user who is on duty at the given moment.
+
+    Executors take turns every ``period`` days starting from ``start_date``, going round the order.
+
+    :return: ``None`` if nobody is on duty: the task is inactive, has no executors, or has not started yet
+    """
+    if task.inactive or executors_count == 0 or at < task.start_date:
+        return None
+    return (at - task.start_date).days // task.period % executors_count
+
+
+def current_executor(
+    task: TaskInfoResponse, executors: list[UserInfo], at: datetime | None = None
+) -> TaskCurrent | None:
+    """
+    Compute locally what ``/bot/task/current_executor`` returns.
+
+    :param executors: Users of the task's order
+    :param at: The moment to compute the executor for, now by default
+    """
+    if at is None:
+        at = datetime.now(task.start_date.tzinfo)
+    number = executor_number(task, len(executors), at)
+    if number is None:
+        return None
+    return TaskCurrent(number=number, user=executors[number])
+
+
+def duties(
+    task: TaskInfoResponse, executors: list[UserInfo], since: datetime
+) -> Iterator[tuple[datetime, TaskCurrent]]:
+    """
+    Iterate over the turns of duty starting from the one in progress at ``since`` (or the first one, if the task has
+    not started yet). Each turn is given by its start and executor. The iterator is infinite unless the task is
+    inactive or has no executors.
+    """
+    if task.inactive or not executors:
+        return
+    period = timedelta(days=task.period)
+    turn = (since - task.start_date).days // task.period if since >= task.start_date else 0
+    while True:
+        number = turn % len(executors)
+        yield task.start_date + turn * period, TaskCurrent(number=number, user=executors[number])
+        turn += 1
+
+
+__all__ = ["current_executor", "duties", "executor_number"]
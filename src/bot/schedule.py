@@ -0,0 +1,115 @@
+import asyncio
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+
+from src.api import client
+from src.api.cache import TTLCache
+from src.api.schemas.method_output_schemas import OrderInfoResponse, TaskInfoResponse, UserInfo
+from src.bot.rotation import duties
+
+# Schedules depend on these reads, and are dropped together with their cached responses.
+_DEPENDENCIES = ("/bot/task/list", "/bot/task/info", "/bot/order/info", "/bot/room/info")
+_TTL = 10 * 60
+
+_cache = TTLCache(256)
+client.add_invalidation_listener(_cache.invalidate)
+
+
+@dataclass(slots=True)
+class ScheduleDay:
+    day: date
+    # Pairs of task names and executors.
+    duties: list[tuple[str, UserInfo]]
+
+
+def _in_task_timezone(task: TaskInfoResponse, at: datetime) -> datetime:
+    """
+    The moment ``at`` in the timezone of the task's start date, as ``rotation.current_executor`` takes "now".
+    """
+    if task.start_date.tzinfo is None:
+        return at.astimezone().replace(tzinfo=None)
+    return at.astimezone(task.start_date.tzinfo)
+
+
+def build_schedule(tasks: list[tuple[TaskInfoResponse, list[UserInfo]]], now: datetime, days: int) -> list[ScheduleDay]:
+    """
+    Compute who is on duty on each of ``days`` days from ``now``.
+
+    The executor of a day is the one on duty at the same time of that day as ``now``, so the first day agrees with
+    the executors shown in the task view, and turns that change during a day are shown from the next day.
+
+    Instead of computing the executor of every task on every day, the calendar is filled by turns of duty: a turn of
+    a task covers ``period`` consecutive days with the same executor, which are filled with a single slice assignment
+    into the task's column. The columns are then transposed into days.
+
+    :param tasks: Tasks with the users of their orders
+    :param now: An aware moment, whose timezone gives the dates of the days
+    """
+    names: list[str] = []
+    columns: list[list[UserInfo | None]] = []
+    for task, executors in tasks:
+        if task.inactive or not executors:
+            continue
+        column: list[UserInfo | None] = [None] * days
+        # Whole days passed from the task's start to ``now``, as ``rotation.executor_number`` counts them.
+        offset = (_in_task_timezone(task, now) - task.start_date).days
+        turn = max(offset, 0) // task.period
+        while (first := turn * task.period - offset) < days:
+            lo, hi = max(first, 0), min(first + task.period, days)
+            column[lo:hi] = [executors[turn % len(executors)]] * (hi - lo)
+            turn += 1
+        names.append(task.name)
+        columns.append(column)
+
+    rows = zip(*columns) if columns else [()] * days
+    return [
+        ScheduleDay(
+            (now + timedelta(days=i)).date(),
+            [(name, executor) for name, executor in zip(names, row) if executor is not None],
+        )
+        for i, row in enumerate(rows)
+    ]
+
+
+def _next_change(tasks: list[tuple[TaskInfoResponse, list[UserInfo]]], now: datetime) -> datetime | None:
+    """
+    The nearest start of a turn after ``now``, when the schedule built at ``now`` gets outdated.
+    """
+    changes = []
+    for task, executors in tasks:
+        at = _in_task_timezone(task, now)
+        for turn_start, _ in duties(task, executors, at):
+            if turn_start > at:
+                changes.append(now + (turn_start - at))
+                break
+    return min(changes, default=None)
+
+
+async def get_room_schedule(room_id: int, user_id: int, now: datetime, days: int) -> list[ScheduleDay]:
+    """
+    The schedule of periodic tasks of the user's room. It is cached per room until a task or an order changes, or
+    a turn of duty ends.
+
+    :param now: An aware moment, whose timezone gives the dates of the days
+    """
+    key = (room_id, now.date(), days)
+    schedule = _cache.get(key)
+    if schedule is not None:
+        return schedule
+
+    tasks = [task for task in await client.get_tasks(user_id) if not task.inactive]
+    infos: list[TaskInfoResponse] = await asyncio.gather(*(client.get_task_info(task.id, user_id) for task in tasks))
+    order_ids = {info.order_id for info in infos if info.order_id is not None}
+    orders: dict[int, OrderInfoResponse] = dict(
+        zip(order_ids, await asyncio.gather(*(client.get_order_info(order_id, user_id) for order_id in order_ids)))
+    )
+    executors = [(info, orders[info.order_id].users if info.order_id is not None else []) for info in infos]
+    schedule = build_schedule(executors, now, days)
+    ttl = _TTL
+    if (change := _next_change(executors, now)) is not None:
+        ttl = min(ttl, (change - now).total_seconds())
+    _cache.set(key, schedule, ttl, tags=_DEPENDENCIES)
+    return schedule
+
+
+__all__ = ["ScheduleDay", "build_schedule", "get_room_schedule"]
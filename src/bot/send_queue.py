@@ -0,0 +1,289 @@
+import asyncio
+import enum
+import logging
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable
+
+from aiogram import Bot
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.types import Message
+
+from src.bot.config import get_settings
+
+
+class Priority(enum.IntEnum):
+    # Replies to users' actions.
+    INTERACTIVE = 0
+    # Messages nobody is waiting for, e.g. daily notifications.
+    BROADCAST = 1
+
+
+class TokenBucket:
+    """
+    Allows ``rate`` events per second on average, with bursts of up to ``capacity`` events.
+    """
+
+    rate: float
+    capacity: float
+    tokens: float
+    updated_at: float
+
+    def __init__(self, rate: float, capacity: float, now: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = now
+
+    def _refill(self, now: float) -> None:
+        if now > self.updated_at:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+
+    def wait_time(self, now: float) -> float:
+        """
+        Seconds until a token is available.
+        """
+        self._refill(now)
+        if self.updated_at > now:
+            # Blocked until ``updated_at`` (see ``block``).
+            return self.updated_at - now + max(0.0, 1 - self.tokens) / self.rate
+        return max(0.0, 1 - self.tokens) / self.rate
+
+    def take(self, now: float) -> None:
+        self._refill(now)
+        self.tokens -= 1
+
+    def block(self, until: float) -> None:
+        """
+        Allow a single event at ``until`` and nothing before it.
+        """
+        self.tokens = 1
+        self.updated_at = max(self.updated_at, until)
+
+    def is_full(self, now: float) -> bool:
+        self._refill(now)
+        return self.tokens >= self.capacity
+
+
+@dataclass(eq=False)
+class _Item:
+    bot: Bot
+    chat_id: int
+    kwargs: dict[str, Any]
+    priority: Priority
+    future: asyncio.Future
+    attempts: int = field(default=0)
+
+
+class SendQueue:
+    """
+    Sends messages within Telegram's flood limits.
+
+    Messages wait in a lane of their priority until both the global token bucket (``global_rate`` messages per second)
+    and the bucket of their chat (``chat_rate`` messages per second) allow them. A lane is served only when the lanes
+    of higher priorities have no message that can be sent right now, and a busy chat does not hold back messages to
+    other chats. When Telegram asks to retry after some time, the chat is paused for that time and the message is
+    returned to the head of its lane, up to ``max_retries`` times.
+
+    Senders of interactive messages wait for the delivery for at most ``reply_timeout`` seconds. A paused chat then
+    does not hold the handler, and the lock on its user's events, for the whole pause.
+
+    Only the messages sent through the queue are counted against the limits. Messages that aiogram-dialog sends and
+    edits to render dialogs bypass it, so the chat rate should leave room for them.
+    """
+
+    global_rate: float
+    chat_rate: float
+    chat_burst: float
+    max_retries: int
+    reply_timeout: float | None
+    _lanes: dict[Priority, deque[_Item]]
+    _global_bucket: TokenBucket | None
+    _chat_buckets: dict[int, TokenBucket]
+    _wakeup: asyncio.Event | None
+    _sending: set[asyncio.Task]
+    _callbacks: set[asyncio.Task]
+    _task: asyncio.Task | None
+
+    _PRUNE_THRESHOLD = 10_000
+
+    def __init__(
+        self,
+        global_rate: float = 30,
+        chat_rate: float = 1,
+        chat_burst: float = 3,
+        max_retries: int = 3,
+        reply_timeout: float | None = 3,
+    ):
+        """
+        :param global_rate: Messages per second across all chats
+        :param chat_rate: Messages per second to one chat
+        :param chat_burst: Messages that can be sent to an idle chat at once
+        :param max_retries: How many times a message is retried after a flood control error
+        :param reply_timeout: Seconds to wait for the delivery of an interactive message, ``None`` for no limit
+        """
+        self.global_rate = global_rate
+        self.chat_rate = chat_rate
+        self.chat_burst = chat_burst
+        self.max_retries = max_retries
+        self.reply_timeout = reply_timeout
+        self._lanes = {priority: deque() for priority in Priority}
+        self._global_bucket = None
+        self._chat_buckets = {}
+        self._wakeup = None
+        self._sending = set()
+        self._callbacks = set()
+        self._task = None
+
+    async def send_message(
+        self,
+        bot: Bot,
+        chat_id: int,
+        text: str,
+        priority: Priority = Priority.INTERACTIVE,
+        on_late_failure: Callable[[], Awaitable[Any]] | None = None,
+        **kwargs: Any,
+    ) -> Message | None:
+        """
+        Queue a message and wait until it is sent. Accepts the same arguments as ``Bot.send_message``.
+
+        :param on_late_failure: Called if the message fails after ``send_message`` has returned ``None``, e.g. to undo
+            what was done for the message. Earlier failures are raised instead.
+        :return: The sent message, or ``None`` if an interactive message has not been sent within ``reply_timeout``.
+            Such a message stays queued, and a failure to send it is logged.
+        """
+        await self.start()
+        item = _Item(bot, chat_id, {"text": text, **kwargs}, priority, asyncio.get_running_loop().create_future())
+        self._lanes[priority].append(item)
+        self._wakeup.set()
+        if priority is Priority.INTERACTIVE and self.reply_timeout is not None:
+            done, _ = await asyncio.wait({item.future}, timeout=self.reply_timeout)
+            if not done:
+                item.future.add_done_callback(lambda future: self._on_late_result(chat_id, future, on_late_failure))
+                return None
+        return await item.future
+
+    def _on_late_result(
+        self, chat_id: int, future: asyncio.Future, on_late_failure: Callable[[], Awaitable[Any]] | None
+    ):
+        if future.cancelled() or future.exception() is None:
+            return
+        logging.warning("Failed to send a message to chat %d: %r", chat_id, future.exception())
+        if on_late_failure is not None:
+            task = asyncio.create_task(on_late_failure())
+            self._callbacks.add(task)
+            task.add_done_callback(self._callbacks.discard)
+
+    @property
+    def pending(self) -> int:
+        return sum(len(lane) for lane in self._lanes.values())
+
+    async def start(self):
+        if self._task is None:
+            loop = asyncio.get_running_loop()
+            self._global_bucket = TokenBucket(self.global_rate, self.global_rate, loop.time())
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self, timeout: float = 5):
+        """
+        Stop sending, giving the queued messages ``timeout`` seconds to go out. Messages left are cancelled.
+        """
+        if self._task is None:
+            return
+        try:
+            async with asyncio.timeout(timeout):
+                while self.pending or self._sending:
+                    await asyncio.sleep(0.05)
+        except TimeoutError:
+            logging.warning("Send queue stopped with %d pending messages", self.pending)
+        self._task.cancel()
+        await asyncio.gather(self._task, *self._sending, *self._callbacks, return_exceptions=True)
+        for lane in self._lanes.values():
+            while lane:
+                lane.popleft().future.cancel()
+        self._task = None
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            if not self.pending:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            now = loop.time()
+            wait = self._global_bucket.wait_time(now)
+            item = None
+            if wait <= 0:
+                item, wait = self._pop_ready(now)
+            if item is None:
+                # A new message may be sendable earlier, e.g. to an idle chat.
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), wait)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            self._global_bucket.take(now)
+            self._chat_bucket(item.chat_id, now).take(now)
+            task = asyncio.create_task(self._deliver(item))
+            self._sending.add(task)
+            task.add_done_callback(self._sending.discard)
+
+    def _pop_ready(self, now: float) -> tuple[_Item | None, float]:
+        """
+        Remove and return the first message of the highest priority that can be sent now, otherwise return the time
+        until any message can be sent.
+        """
+        soonest = float("inf")
+        for lane in self._lanes.values():
+            for index, item in enumerate(lane):
+                if item.future.done():
+                    # The sender has stopped waiting.
+                    del lane[index]
+                    return None, 0
+                wait = self._chat_bucket(item.chat_id, now).wait_time(now)
+                if wait <= 0:
+                    del lane[index]
+                    return item, 0
+                soonest = min(soonest, wait)
+        return None, soonest
+
+    def _chat_bucket(self, chat_id: int, now: float) -> TokenBucket:
+        bucket = self._chat_buckets.get(chat_id)
+        if bucket is None:
+            if len(self._chat_buckets) >= self._PRUNE_THRESHOLD:
+                # Idle chats are indistinguishable from new ones.
+                self._chat_buckets = {key: value for key, value in self._chat_buckets.items() if not value.is_full(now)}
+            bucket = self._chat_buckets[chat_id] = TokenBucket(self.chat_rate, self.chat_burst, now)
+        return bucket
+
+    async def _deliver(self, item: _Item):
+        try:
+            message = await item.bot.send_message(item.chat_id, **item.kwargs)
+        except TelegramRetryAfter as e:
+            item.attempts += 1
+            if item.attempts <= self.max_retries:
+                logging.info("Flood control in chat %d, retrying in %d seconds", item.chat_id, e.retry_after)
+                loop = asyncio.get_running_loop()
+                self._chat_bucket(item.chat_id, loop.time()).block(loop.time() + e.retry_after)
+                self._lanes[item.priority].appendleft(item)
+                self._wakeup.set()
+            elif not item.future.done():
+                item.future.set_exception(e)
+        except Exception as e:
+            if not item.future.done():
+                item.future.set_exception(e)
+        else:
+            if not item.future.done():
+                item.future.set_result(message)
+
+
+send_queue = SendQueue(
+    global_rate=get_settings().SEND_GLOBAL_RATE,
+    chat_rate=get_settings().SEND_CHAT_RATE,
+    reply_timeout=get_settings().SEND_REPLY_TIMEOUT,
+)
+
+__all__ = ["Priority", "SendQueue", "TokenBucket", "send_queue"]
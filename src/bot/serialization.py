@@ -0,0 +1,163 @@
+import dataclasses
+import re
+import zlib
+from datetime import datetime
+from typing import Any, Callable
+
+import msgpack
+from pydantic import BaseModel
+
+from src.api.schemas import method_output_schemas as outputs
+from src.bot import utils
+from src.bot.dialogs import dialog_communications as communications
+
+# Types stored as positional tuples of their fields. The list is append-only: an index is a part of stored data.
+COMPACT_TYPES: list[type] = [
+    outputs.UserInfo,
+    outputs.TaskDailyInfo,
+    outputs.DailyInfoResponse,
+    outputs.IncomingInvitationInfo,
+    outputs.RoomInfoResponse,
+    outputs.TaskInfo,
+    outputs.TaskInfoResponse,
+    outputs.SentInvitationInfo,
+    outputs.OrderInfoResponse,
+    outputs.ListOfOrdersResponse,
+    outputs.RuleInfo,
+    outputs.ManualTaskInfo,
+    outputs.ManualTaskInfoResponse,
+    outputs.TaskCurrent,
+    communications.RoomDialogStartData,
+    communications.ConfirmationDialogStartData,
+    communications.IncomingInvitationDialogStartData,
+    communications.TaskViewDialogStartData,
+    communications.PromptDialogStartData,
+    communications.CreatePeriodicTaskForm,
+    communications.CreateRuleForm,
+    communications.CreateManualTaskForm,
+    communications.CreateTaskStartData,
+    communications.CreateOrderStartData,
+]
+
+# Functions stored by their index, e.g. filters of prompts. The list is append-only as well.
+CALLABLES: list[Callable[..., Any]] = [
+    utils.datetime_validator,
+    utils.positive_int_validator,
+]
+
+# Codes 0 (pickles) and 4 (functions by their import paths) were used by older versions and are not loaded anymore.
+_OBJECT_EXT = 1
+_DATETIME_EXT = 2
+_PATTERN_EXT = 3
+_TUPLE_EXT = 5
+_CALLABLE_EXT = 6
+
+
+class DialogDataSerializer:
+    """
+    Serializes FSM data (aiogram-dialog stacks and contexts) with msgpack.
+
+    Pydantic models and dataclasses listed in ``COMPACT_TYPES`` are stored as a type index and a tuple of field
+    values instead of field name-value maps. Models are rebuilt without validation, as the data has already been
+    validated once. Each object also carries a fingerprint of its type's name and field names: if the fields have
+    been added, removed or reordered since the data was stored, ``loads`` raises ``ValueError``.
+
+    Functions listed in ``CALLABLES`` are stored by their index. Nothing else is stored by reference and nothing is
+    pickled, so loading data can't import modules or run code: ``dumps`` raises ``TypeError`` for other types that
+    msgpack can't represent, and ``loads`` raises ``ValueError`` for unknown references and extension types.
+    """
+
+    _type_indices: dict[type, int]
+    _fields: list[tuple[str, ...]]
+    _fingerprints: list[int]
+    _factories: list[Callable[..., Any]]
+    _callables: list[Callable[..., Any]]
+    _callable_indices: dict[Callable[..., Any], int]
+
+    def __init__(self, compact_types: list[type] = COMPACT_TYPES, callables: list[Callable[..., Any]] = CALLABLES):
+        self._type_indices = {type_: index for index, type_ in enumerate(compact_types)}
+        self._fields = [self._field_names(type_) for type_ in compact_types]
+        self._fingerprints = [
+            self._fingerprint(type_, fields) for type_, fields in zip(compact_types, self._fields, strict=True)
+        ]
+        self._factories = [
+            self._model_factory(type_) if issubclass(type_, BaseModel) else type_ for type_ in compact_types
+        ]
+        self._callables = list(callables)
+        self._callable_indices = {function: index for index, function in enumerate(callables)}
+
+    @staticmethod
+    def _model_factory(model: type[BaseModel]) -> Callable[..., BaseModel]:
+        """
+        A faster equivalent of ``model_construct``: restores the model the same way as unpickling does.
+        """
+
+        def factory(**values: Any) -> BaseModel:
+            instance = model.__new__(model)
+            instance.__setstate__(
+                {
+                    "__dict__": values,
+                    "__pydantic_fields_set__": set(values),
+                    "__pydantic_extra__": None,
+                    "__pydantic_private__": None,
+                }
+            )
+            return instance
+
+        return factory
+
+    @staticmethod
+    def _field_names(type_: type) -> tuple[str, ...]:
+        if issubclass(type_, BaseModel):
+            return tuple(type_.model_fields)
+        return tuple(field.name for field in dataclasses.fields(type_))
+
+    @staticmethod
+    def _fingerprint(type_: type, fields: tuple[str, ...]) -> int:
+        return zlib.crc32(f"{type_.__module__}.{type_.__qualname__}:{','.join(fields)}".encode())
+
+    def dumps(self, data: Any) -> bytes:
+        # Strict types let tuples reach ``_default`` instead of turning into lists.
+        return msgpack.packb(data, default=self._default, use_bin_type=True, strict_types=True)
+
+    def loads(self, value: bytes) -> Any:
+        return msgpack.unpackb(value, ext_hook=self._ext_hook, raw=False, strict_map_key=False)
+
+    def _default(self, obj: Any) -> msgpack.ExtType:
+        index = self._type_indices.get(type(obj))
+        if index is not None:
+            values = [getattr(obj, name) for name in self._fields[index]]
+            return msgpack.ExtType(_OBJECT_EXT, self.dumps([index, self._fingerprints[index], *values]))
+        if isinstance(obj, tuple) and not hasattr(obj, "_fields"):
+            return msgpack.ExtType(_TUPLE_EXT, self.dumps(list(obj)))
+        if isinstance(obj, datetime):
+            return msgpack.ExtType(_DATETIME_EXT, obj.isoformat().encode())
+        if isinstance(obj, re.Pattern):
+            return msgpack.ExtType(_PATTERN_EXT, self.dumps([obj.pattern, obj.flags]))
+        if callable(obj) and (index := self._callable_indices.get(obj)) is not None:
+            return msgpack.ExtType(_CALLABLE_EXT, self.dumps(index))
+        raise TypeError(f"Cannot serialize an object of type {type(obj).__qualname__}")
+
+    def _ext_hook(self, code: int, data: bytes) -> Any:
+        if code == _OBJECT_EXT:
+            index, fingerprint, *values = self.loads(data)
+            if index >= len(self._fingerprints) or fingerprint != self._fingerprints[index]:
+                # The type's fields have changed since the data was stored, the values can't be matched to them.
+                raise ValueError(f"Stored object of compact type {index} does not match its current fields")
+            return self._factories[index](**dict(zip(self._fields[index], values, strict=True)))
+        if code == _TUPLE_EXT:
+            return tuple(self.loads(data))
+        if code == _DATETIME_EXT:
+            return datetime.fromisoformat(data.decode())
+        if code == _PATTERN_EXT:
+            pattern, flags = self.loads(data)
+            return re.compile(pattern, flags)
+        if code == _CALLABLE_EXT:
+            index = self.loads(data)
+            if not isinstance(index, int) or not 0 <= index < len(self._callables):
+                raise ValueError(f"Stored function {index!r} is not allowed")
+            return self._callables[index]
+        raise ValueError(f"Unsupported extension type {code}")
+
+
+__all__ = ["CALLABLES", "COMPACT_TYPES", "DialogDataSerializer"]
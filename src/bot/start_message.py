@@ -7,18 +7,14 @@ from src.bot.dialogs.states import RoomlessSG, RoomSG
 
 
 async def start_message_handler(message: Message, dialog_manager: DialogManager):
+    # The user is registered by UpdateUserInfoMiddleware when they are missing in its cache.
     user_id = message.from_user.id
-    try:
-        await client.create_user(user_id)
-    except RuntimeError:
-        pass
-
-    try:
-        room_info = await client.get_room_info(user_id)
-        await dialog_manager.start(
-            RoomSG.main,
-            data={"input": RoomDialogStartData(room_info.id, room_info.name)},
-            mode=StartMode.RESET_STACK,
-        )
-    except RuntimeError:
+    room_info = await client.get_room_info_or_none(user_id)
+    if room_info is None:
         await dialog_manager.start(RoomlessSG.welcome, mode=StartMode.RESET_STACK)
+        return
+    await dialog_manager.start(
+        RoomSG.main,
+        data={"input": RoomDialogStartData(room_info.id, room_info.name)},
+        mode=StartMode.RESET_STACK,
+    )
@@ -0,0 +1,64 @@
+import logging
+from typing import Any, Dict
+
+from aiogram.fsm.storage.base import DefaultKeyBuilder, StorageKey
+from aiogram.fsm.storage.redis import RedisStorage
+from redis.asyncio import Redis
+
+from src.bot.serialization import DialogDataSerializer
+
+
+class DialogRedisStorage(RedisStorage):
+    """
+    Redis FSM storage that keeps data in the compact binary format of ``DialogDataSerializer``.
+
+    Dialogs store pydantic models and dataclasses in their data, which JSON cannot represent.
+    """
+
+    serializer: DialogDataSerializer
+
+    def __init__(
+        self,
+        redis: Redis,
+        state_ttl: int | None = None,
+        data_ttl: int | None = None,
+        serializer: DialogDataSerializer | None = None,
+    ):
+        """
+        :param redis: A Redis connection
+        :param state_ttl: Expiration time of states in seconds
+        :param data_ttl: Expiration time of data in seconds
+        """
+        # aiogram-dialog keeps its stacks and contexts under separate destinies.
+        super().__init__(
+            redis,
+            key_builder=DefaultKeyBuilder(prefix="rooms_bot:fsm", with_destiny=True),
+            state_ttl=state_ttl,
+            data_ttl=data_ttl,
+        )
+        self.serializer = serializer or DialogDataSerializer()
+
+    async def close(self) -> None:
+        # The connection is shared with other components and is closed by its owner.
+        pass
+
+    async def set_data(self, key: StorageKey, data: Dict[str, Any]) -> None:
+        redis_key = self.key_builder.build(key, "data")
+        if not data:
+            await self.redis.delete(redis_key)
+            return
+        await self.redis.set(redis_key, self.serializer.dumps(data), ex=self.data_ttl)
+
+    async def get_data(self, key: StorageKey) -> Dict[str, Any]:
+        value = await self.redis.get(self.key_builder.build(key, "data"))
+        if value is None:
+            return {}
+        try:
+            return self.serializer.loads(value)
+        except ValueError:
+            # E.g. data written in another format by an older version. The user restarts the dialog with /start.
+            logging.warning("Dropping unreadable FSM data for %s", key)
+            return {}
+
+
+__all__ = ["DialogRedisStorage"]
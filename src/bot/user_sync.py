@@ -0,0 +1,162 @@
+import asyncio
+import logging
+import time
+
+from src.api import client
+from src.api.exceptions import NotFound
+from src.api.schemas.method_input_schemas import UserProfileBody
+from src.bot.cachers import AliasCacher, UserInfo
+
+
+async def sync_user_info(cache: AliasCacher, user_id: int, info: UserInfo, cached: UserInfo | None):
+    """
+    Push the fields of the user's info that differ from the cached ones to the backend and cache the new info.
+    """
+    if cached == info:
+        return
+    if cached is None or info.alias != cached.alias:
+        await client.save_user_alias(info.alias, user_id)
+    if cached is None or info.fullname != cached.fullname:
+        await client.save_user_fullname(info.fullname, user_id)
+    await cache.set(user_id, info)
+
+
+class UserSyncWorker:
+    """
+    Syncs users' info with the backend in the background.
+
+    Submissions are deduplicated per user and accumulated for ``flush_interval`` seconds, then pushed with one
+    batched request per ``batch_size`` users. If the backend does not support batched updates, every user is
+    synced with separate requests. A failed sync is retried with an exponential backoff.
+    """
+
+    cache: AliasCacher
+    flush_interval: float
+    batch_size: int
+    retries: int
+    retry_delay: float
+    _pending: dict[int, UserInfo]
+    _attempts: dict[int, int]
+    _retry_at: dict[int, float]
+    _batch_supported: bool
+    _task: asyncio.Task | None
+
+    def __init__(
+        self,
+        cache: AliasCacher,
+        flush_interval: float = 1,
+        batch_size: int = 100,
+        retries: int = 3,
+        retry_delay: float = 1,
+    ):
+        self.cache = cache
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self._pending = {}
+        self._attempts = {}
+        self._retry_at = {}
+        self._batch_supported = True
+        self._task = None
+
+    def submit(self, user_id: int, info: UserInfo):
+        self._pending[user_id] = info
+        # New info resets the retry counter.
+        self._attempts.pop(user_id, None)
+        self._retry_at.pop(user_id, None)
+
+    async def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self, timeout: float = 5):
+        """
+        Stop flushing periodically and make the last attempt to push pending updates within ``timeout`` seconds.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        self._retry_at.clear()
+        try:
+            await asyncio.wait_for(self.flush(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        if self._pending:
+            logging.warning("User sync stopped with %d pending users", len(self._pending))
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception:
+                logging.exception("Failed to flush user info")
+
+    async def flush(self):
+        now = time.monotonic()
+        ready = [user_id for user_id in self._pending if self._retry_at.get(user_id, 0) <= now]
+        for start in range(0, len(ready), self.batch_size):
+            batch = {user_id: self._pending.pop(user_id) for user_id in ready[start : start + self.batch_size]}
+            failed = await self._sync_batch(batch)
+            for user_id, info in batch.items():
+                if user_id in failed:
+                    self._retry(user_id, info)
+                else:
+                    self._attempts.pop(user_id, None)
+                    self._retry_at.pop(user_id, None)
+
+    async def _sync_batch(self, batch: dict[int, UserInfo]) -> set[int]:
+        """
+        Push the batch to the backend and return ids of users whose sync failed.
+        """
+        cached = await self.cache.get_many(list(batch))
+        changed = {user_id: info for user_id, info in batch.items() if cached[user_id] != info}
+        if not changed:
+            return set()
+
+        if self._batch_supported:
+            profiles = [
+                UserProfileBody(user_id=user_id, alias=info.alias, fullname=info.fullname)
+                for user_id, info in changed.items()
+            ]
+            try:
+                await client.save_users_profiles(profiles)
+            except NotFound:
+                logging.info("Batched profile updates are not supported by the backend, syncing users one by one")
+                self._batch_supported = False
+            except Exception:
+                logging.exception("Failed to sync info of %d users", len(changed))
+                return set(changed)
+            else:
+                await asyncio.gather(*(self.cache.set(user_id, info) for user_id, info in changed.items()))
+                return set()
+
+        results = await asyncio.gather(
+            *(sync_user_info(self.cache, user_id, info, cached[user_id]) for user_id, info in changed.items()),
+            return_exceptions=True,
+        )
+        failed = set()
+        for user_id, result in zip(changed, results):
+            if isinstance(result, Exception):
+                logging.error("Failed to sync info of user %d: %r", user_id, result)
+                failed.add(user_id)
+        return failed
+
+    def _retry(self, user_id: int, info: UserInfo):
+        if user_id in self._pending:
+            # Newer info has been submitted meanwhile.
+            return
+        attempt = self._attempts.get(user_id, 0)
+        if attempt >= self.retries:
+            logging.error("Gave up syncing info of user %d", user_id)
+            self._attempts.pop(user_id, None)
+            self._retry_at.pop(user_id, None)
+            return
+        self._pending[user_id] = info
+        self._attempts[user_id] = attempt + 1
+        self._retry_at[user_id] = time.monotonic() + self.retry_delay * 2**attempt
+
+
+__all__ = ["sync_user_info", "UserSyncWorker"]
@@ -4,6 +4,11 @@ from typing import Callable, Awaitable, Any, TypeVar
 from aiogram.types import CallbackQuery
 from aiogram_dialog import DialogManager, SubManager
 
+from src.api.schemas.method_output_schemas import UserInfo
+from src.bot.cachers import RemindRegistry
+from src.bot.config import get_settings
+from src.bot.send_queue import send_queue
+
 T = TypeVar("T")
 
 
@@ -86,3 +91,89 @@ def datetime_validator(text: str) -> bool:
         return False
     else:
         return True
+
+
+def positive_int_validator(text: str) -> bool:
+    return text.isdecimal() and int(text) > 0
+
+
+async def remind_executor(
+    callback: CallbackQuery, manager: DialogManager, task_key: str, task_name: str, executor: UserInfo
+):
+    """
+    Remind the executor about their duty, unless the executor has been reminded about the task recently.
+
+    :param task_key: A key unique among tasks of all kinds, e.g. ``periodic:1``
+    """
+    registry: RemindRegistry | None = manager.middleware_data.get("remind_registry")
+    key = f"{task_key}:{executor.id}"
+    if registry is not None:
+        elapsed = await registry.try_remind(key, get_settings().REMIND_COOLDOWN)
+        if elapsed is not None:
+            minutes = int(elapsed // 60)
+            ago = f"{minutes} minutes ago" if minutes else "less than a minute ago"
+            await callback.answer(f"{executor.fullname or 'The executor'} was already reminded {ago}")
+            return
+
+    async def forget():
+        # The executor has not been reminded, so the next tap tries again.
+        if registry is not None:
+            await registry.forget(key)
+
+    try:
+        await send_queue.send_message(
+            callback.bot,
+            executor.id,
+            f'{callback.from_user.full_name} reminds you about your duty in "{task_name}"',
+            on_late_failure=forget,
+        )
+    except Exception:
+        await forget()
+        raise
+
+
+async def get_page(
+    manager: DialogManager,
+    list_name: str,
+    scroll_id: str,
+    page_size: int,
+    fetch: Callable[[int, int], Awaitable[list[T]]],
+) -> tuple[list[T], int]:
+    """
+    Get the current page of a list shown with ``aiogram_dialog.widgets.kbd.StubScroll``, fetching only the items
+    that have not been loaded yet.
+
+    Loaded items are kept in dialog data, so ``select_finder`` works with them as with a whole list, and every page
+    is fetched once during the life of the dialog. To load the list again, use ``reset_pages``.
+    :param list_name: The list's name in ``DialogManager``'s dialog data
+    :param scroll_id: The id of the ``StubScroll``
+    :param fetch: A function that fetches at most ``limit`` items starting from ``offset``
+    :return: The items of the current page and the number of pages known so far
+    """
+    scroll = manager.find(scroll_id)
+    page = await scroll.get_page()
+    items: list[T] = manager.dialog_data.setdefault(list_name, [])
+    complete_key = f"{list_name}_complete"
+
+    missing = (page + 1) * page_size - len(items)
+    if not manager.dialog_data.get(complete_key, False) and missing > 0:
+        # One more item is requested to know whether there is a next page.
+        fetched = await fetch(len(items), missing + 1)
+        manager.dialog_data[complete_key] = len(fetched) <= missing
+        items.extend(fetched[:missing])
+
+    complete = manager.dialog_data.get(complete_key, False)
+    pages = max(1, -(-len(items) // page_size)) + (0 if complete else 1)
+    if page >= pages:
+        # The list has shrunk since the page was opened.
+        page = pages - 1
+        await scroll.set_page(page)
+    return items[page * page_size : (page + 1) * page_size], pages
+
+
+def reset_pages(manager: DialogManager, list_name: str):
+    """
+    Drop the pages loaded by ``get_page``, so that they are fetched again when the list is shown.
+    """
+    manager.dialog_data.pop(list_name, None)
+    manager.dialog_data.pop(f"{list_name}_complete", None)
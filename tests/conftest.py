@@ -0,0 +1,13 @@
+import os
+
+import fakeredis
+import pytest
+
+# The settings are read when the API client is created on import of ``src.api``.
+for _name in ("BOT_TOKEN", "API_URL", "API_SECRET"):
+    os.environ.setdefault(_name, "test")
+
+
+@pytest.fixture
+def redis() -> fakeredis.FakeAsyncRedis:
+    return fakeredis.FakeAsyncRedis(server=fakeredis.FakeServer())
@@ -0,0 +1,49 @@
+"""
+Records the backend's answers to ``/bot/task/current_executor`` for all periodic tasks of a user's room, together with
+the tasks and their orders, into ``tests/fixtures/current_executor_answers.json``. ``tests/test_rotation.py`` checks
+the local rotation against every recorded answer.
+
+Run against a backend with real rooms: python -m tests.record_rotation_answers <user id>
+"""
+
+import asyncio
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+
+from src.api import client
+
+FIXTURE = Path(__file__).parent / "fixtures" / "current_executor_answers.json"
+
+
+async def record(user_id: int) -> list[dict]:
+    answers = []
+    for task in await client.get_tasks(user_id):
+        info = await client.get_task_info(task.id, user_id)
+        users = (await client.get_order_info(info.order_id, user_id)).users if info.order_id is not None else []
+        current = await client.get_task_current_executor(task.id, user_id)
+        answers.append(
+            {
+                "source": "recorded",
+                "task": info.model_dump(mode="json"),
+                "order": [user.model_dump(mode="json") for user in users],
+                "at": datetime.now(info.start_date.tzinfo).isoformat(),
+                "current": current.model_dump(mode="json") if current is not None else None,
+            }
+        )
+    return answers
+
+
+async def main(user_id: int):
+    try:
+        answers = await record(user_id)
+    finally:
+        await client.close()
+    existing = json.loads(FIXTURE.read_text()) if FIXTURE.exists() else []
+    FIXTURE.write_text(json.dumps(existing + answers, indent=2, ensure_ascii=False) + "\n")
+    print(f"Recorded {len(answers)} answers to {FIXTURE}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1])))
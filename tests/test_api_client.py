@@ -0,0 +1,77 @@
+import pytest
+
+from src.api import InNoHassleMusicRoomAPI
+from src.api.exceptions import Conflict, Unavailable, Validation
+
+
+class RoomlessBackend:
+    def __init__(self):
+        self.reads = 0
+        self.has_room = False
+
+    async def post(self, path: str, user_id: int = None, **data) -> bytes:
+        self.reads += 1
+        if not self.has_room:
+            raise Conflict("User does not have a room", 400, 3)
+        return b'{"id": 1, "name": "Room", "users": []}'
+
+
+@pytest.fixture
+def backend() -> RoomlessBackend:
+    return RoomlessBackend()
+
+
+@pytest.fixture
+def api(backend: RoomlessBackend) -> InNoHassleMusicRoomAPI:
+    api = InNoHassleMusicRoomAPI("http://backend", "secret")
+    api._post = backend.post
+    return api
+
+
+async def test_errors_are_not_cached(api: InNoHassleMusicRoomAPI, backend: RoomlessBackend):
+    assert await api.get_room_info_or_none(1) is None
+    # E.g. the user has accepted an invitation through another replica.
+    backend.has_room = True
+    room = await api.get_room_info_or_none(1)
+    assert room is not None and room.id == 1
+    assert backend.reads == 2
+
+
+async def test_responses_are_cached(api: InNoHassleMusicRoomAPI, backend: RoomlessBackend):
+    backend.has_room = True
+    await api.get_room_info(1)
+    await api.get_room_info(1)
+    assert backend.reads == 1
+
+
+class InvitationBackend:
+    def __init__(self, errors: dict[str, Exception]):
+        self.errors = errors
+        self.invited: list[str] = []
+
+    async def post(self, path: str, user_id: int = None, **data) -> bytes:
+        alias = data["addressee"]["alias"]
+        if alias in self.errors:
+            raise self.errors[alias]
+        self.invited.append(alias)
+        return str(len(self.invited)).encode()
+
+
+async def test_rejected_invitations_are_returned():
+    api = InNoHassleMusicRoomAPI("http://backend", "secret")
+    backend = InvitationBackend({"taken_alias": Conflict("Already invited", 400, 7), "bad": Validation("Too short")})
+    api._post = backend.post
+    results = await api.invite_people(["first_alias", "taken_alias", "bad"], 1)
+    assert results["first_alias"] == 1
+    assert isinstance(results["taken_alias"], Conflict)
+    assert isinstance(results["bad"], Validation)
+
+
+async def test_unavailable_backend_fails_invitations():
+    api = InNoHassleMusicRoomAPI("http://backend", "secret")
+    backend = InvitationBackend({"second_alias": Unavailable("ClientConnectorError(...)")})
+    api._post = backend.post
+    with pytest.raises(Unavailable):
+        await api.invite_people(["first_alias", "second_alias", "third_alias"], 1)
+    # The other requests have finished rather than been left running.
+    assert backend.invited == ["first_alias", "third_alias"]
@@ -0,0 +1,78 @@
+import asyncio
+
+import pytest
+
+from src.api import InNoHassleMusicRoomAPI
+from src.api.schemas.method_input_schemas import CreateRuleBody
+from src.bot.cache_invalidation import CacheInvalidationBroadcaster
+
+CHANNEL = "rooms_bot:api_invalidations"
+
+
+class FakeBackend:
+    def __init__(self):
+        self.reads = 0
+
+    async def post(self, path: str, user_id: int = None, **data) -> bytes:
+        if path == "/bot/rule/list":
+            self.reads += 1
+            return b"[]"
+        return b"1"
+
+
+class Instance:
+    """
+    An API client of one bot instance, recording invalidations of its cache.
+    """
+
+    def __init__(self, backend: FakeBackend):
+        self.api = InNoHassleMusicRoomAPI("http://backend", "secret")
+        self.api._post = backend.post
+        self.invalidations: list[tuple[str, ...]] = []
+        self.api.add_invalidation_listener(lambda *paths: self.invalidations.append(paths))
+
+
+@pytest.fixture
+async def instances(redis):
+    backend = FakeBackend()
+    first, second = Instance(backend), Instance(backend)
+    broadcasters = [CacheInvalidationBroadcaster(redis, first.api), CacheInvalidationBroadcaster(redis, second.api)]
+    for broadcaster in broadcasters:
+        await broadcaster.start()
+    async with asyncio.timeout(1):
+        while (await redis.pubsub_numsub(CHANNEL))[0][1] < len(broadcasters):
+            await asyncio.sleep(0.01)
+    first.invalidations.clear()
+    second.invalidations.clear()
+    yield backend, first, second
+    for broadcaster in broadcasters:
+        await broadcaster.stop()
+
+
+async def test_write_invalidates_other_instances(instances):
+    backend, first, second = instances
+    await first.api.get_rules(1)
+    await second.api.get_rules(1)
+    await second.api.get_rules(1)
+    assert backend.reads == 2
+
+    await first.api.create_rule(CreateRuleBody(name="Rule", text="Text"), 1)
+    async with asyncio.timeout(1):
+        while not second.invalidations:
+            await asyncio.sleep(0.01)
+    assert second.invalidations == [("/bot/rule/list",)]
+    await second.api.get_rules(1)
+    assert backend.reads == 3
+
+
+async def test_own_writes_are_not_invalidated_twice(instances):
+    backend, first, second = instances
+    await first.api.create_rule(CreateRuleBody(name="Rule", text="Text"), 1)
+    await first.api.get_rules(1)
+    async with asyncio.timeout(1):
+        while not second.invalidations:
+            await asyncio.sleep(0.01)
+    # The response cached after the write survives the instance's own message.
+    assert first.invalidations == [("/bot/rule/list",)]
+    await first.api.get_rules(1)
+    assert backend.reads == 1
@@ -0,0 +1,134 @@
+import asyncio
+from datetime import date
+
+import pytest
+
+from src.bot.cachers import (
+    AliasCacher,
+    MemoryAliasCacher,
+    MemoryRemindRegistry,
+    MemoryRoomRegistry,
+    RedisAliasCacher,
+    RedisRemindRegistry,
+    RedisRoomRegistry,
+    RemindRegistry,
+    RoomRegistry,
+    UserInfo,
+)
+
+
+@pytest.fixture(params=["memory", "redis"])
+def alias_cacher(request, redis) -> AliasCacher:
+    return MemoryAliasCacher() if request.param == "memory" else RedisAliasCacher(redis)
+
+
+@pytest.fixture(params=["memory", "redis"])
+def room_registry(request, redis) -> RoomRegistry:
+    return MemoryRoomRegistry() if request.param == "memory" else RedisRoomRegistry(redis)
+
+
+@pytest.fixture(params=["memory", "redis"])
+def remind_registry(request, redis) -> RemindRegistry:
+    return MemoryRemindRegistry() if request.param == "memory" else RedisRemindRegistry(redis)
+
+
+async def test_alias_cacher_round_trip(alias_cacher: AliasCacher):
+    info = UserInfo("alias", "Full Name")
+    assert await alias_cacher.get(1) is None
+    assert not await alias_cacher.check(1, info)
+
+    await alias_cacher.set(1, info)
+    await alias_cacher.set(2, UserInfo(None, None))
+    assert await alias_cacher.get(1) == info
+    assert await alias_cacher.check(1, info)
+    assert not await alias_cacher.check(1, UserInfo("alias", "Another Name"))
+    assert await alias_cacher.get_many([1, 2, 3]) == {1: info, 2: UserInfo(None, None), 3: None}
+    assert await alias_cacher.get_many([]) == {}
+
+    await alias_cacher.delete(1)
+    assert await alias_cacher.get(1) is None
+
+
+async def test_redis_alias_cacher_ttl(redis):
+    cacher = RedisAliasCacher(redis, ttl=60)
+    await cacher.set(1, UserInfo("alias", None))
+    assert 0 < await redis.ttl("rooms_bot:alias:1") <= 60
+
+
+async def test_room_registry_round_trip(room_registry: RoomRegistry):
+    await room_registry.add(1, 10)
+    await room_registry.add(2, 20)
+    assert await room_registry.rooms() == {1: 10, 2: 20}
+    assert await room_registry.get_last_sent_many([1, 2]) == {1: None, 2: None}
+
+    assert await room_registry.claim(1, date(2024, 9, 1))
+    assert await room_registry.get_last_sent(1) == date(2024, 9, 1)
+    assert await room_registry.get_last_sent_many([1, 2, 3]) == {1: date(2024, 9, 1), 2: None, 3: None}
+
+
+async def test_room_registry_remove(room_registry: RoomRegistry):
+    await room_registry.add(1, 10)
+    await room_registry.claim(1, date(2024, 9, 1))
+
+    # Only the member the room is queried with removes it.
+    await room_registry.remove(1, 11)
+    assert await room_registry.rooms() == {1: 10}
+
+    await room_registry.remove(1, 10)
+    assert await room_registry.rooms() == {}
+    assert await room_registry.get_last_sent(1) is None
+
+
+async def test_room_registry_claim(room_registry: RoomRegistry):
+    await room_registry.add(1, 10)
+    assert await room_registry.claim(1, date(2024, 9, 1))
+    assert not await room_registry.claim(1, date(2024, 9, 1))
+    assert await room_registry.claim(1, date(2024, 9, 2))
+
+
+async def test_room_registry_concurrent_claims(room_registry: RoomRegistry):
+    await room_registry.add(1, 10)
+    results = await asyncio.gather(*(room_registry.claim(1, date(2024, 9, 1)) for _ in range(20)))
+    assert results.count(True) == 1
+
+
+async def test_redis_room_registries_share_claims(redis):
+    # Two bot instances with the same Redis.
+    first, second = RedisRoomRegistry(redis), RedisRoomRegistry(redis)
+    await first.add(1, 10)
+    assert await second.rooms() == {1: 10}
+    results = await asyncio.gather(
+        *(registry.claim(1, date(2024, 9, 1)) for registry in (first, second) for _ in range(10))
+    )
+    assert results.count(True) == 1
+    assert 0 < await redis.ttl("rooms_bot:duty:claim:1:2024-09-01") <= 2 * 24 * 60 * 60
+
+
+async def test_remind_registry_cooldown(remind_registry: RemindRegistry):
+    assert await remind_registry.try_remind("task:1", 60) is None
+    since = await remind_registry.try_remind("task:1", 60)
+    assert since is not None and 0 <= since < 60
+    assert await remind_registry.try_remind("task:2", 60) is None
+
+    await remind_registry.forget("task:1")
+    assert await remind_registry.try_remind("task:1", 60) is None
+
+
+async def test_remind_registry_concurrent_reminders(remind_registry: RemindRegistry):
+    results = await asyncio.gather(*(remind_registry.try_remind("task:1", 60) for _ in range(20)))
+    assert results.count(None) == 1
+
+
+async def test_redis_remind_registry_expires(redis):
+    registry = RedisRemindRegistry(redis)
+    await registry.try_remind("task:1", 60)
+    assert 0 < await redis.ttl("rooms_bot:remind:task:1") <= 60
+
+
+async def test_redis_remind_registries_share_records(redis):
+    # Two bot instances with the same Redis.
+    first, second = RedisRemindRegistry(redis), RedisRemindRegistry(redis)
+    results = await asyncio.gather(
+        *(registry.try_remind("task:1", 60) for registry in (first, second) for _ in range(10))
+    )
+    assert results.count(None) == 1
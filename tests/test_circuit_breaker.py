@@ -0,0 +1,102 @@
+import pytest
+
+from src.api import InNoHassleMusicRoomAPI
+from src.api import circuit_breaker
+from src.api.circuit_breaker import CircuitBreaker
+from src.api.exceptions import CircuitOpen
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(circuit_breaker.time, "monotonic", clock)
+    return clock
+
+
+def open_breaker(breaker: CircuitBreaker):
+    for _ in range(breaker.failure_threshold):
+        breaker.before_call()
+        breaker.record_failure()
+
+
+def test_opens_after_consecutive_failures(clock: Clock):
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_failure()
+    assert not breaker.is_open
+    breaker.record_failure()
+    assert breaker.is_open
+    with pytest.raises(CircuitOpen):
+        breaker.before_call()
+
+
+def test_single_probe_after_reset_timeout(clock: Clock):
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30)
+    open_breaker(breaker)
+    clock.now += 30
+    breaker.before_call()
+    # Other calls wait for the probe's result.
+    with pytest.raises(CircuitOpen):
+        breaker.before_call()
+
+
+def test_successful_probe_closes(clock: Clock):
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30)
+    open_breaker(breaker)
+    clock.now += 30
+    breaker.before_call()
+    breaker.record_success()
+    assert not breaker.is_open
+    breaker.before_call()
+
+
+def test_failed_probe_opens_again(clock: Clock):
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30)
+    open_breaker(breaker)
+    clock.now += 30
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.is_open
+    clock.now += 29
+    with pytest.raises(CircuitOpen):
+        breaker.before_call()
+    clock.now += 1
+    breaker.before_call()
+
+
+def test_cancelled_probe_lets_next_call_probe(clock: Clock):
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30)
+    open_breaker(breaker)
+    clock.now += 30
+    breaker.before_call()
+    breaker.record_cancel()
+    assert breaker.is_open
+    breaker.before_call()
+
+
+class BrokenSession:
+    closed = False
+
+    def post(self, *args, **kwargs):
+        raise UnicodeDecodeError("utf-8", b"\xff", 0, 1, "invalid start byte")
+
+
+async def test_unexpected_error_of_probe_does_not_block_calls(clock: Clock):
+    api = InNoHassleMusicRoomAPI("http://backend", "secret")
+    api._session = BrokenSession()
+    open_breaker(api._breaker)
+    clock.now += api._breaker.reset_timeout
+    with pytest.raises(UnicodeDecodeError):
+        await api._post("/bot/room/info", 1)
+    with pytest.raises(UnicodeDecodeError):
+        await api._post("/bot/room/info", 1)
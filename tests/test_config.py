@@ -0,0 +1,30 @@
+import pytest
+from pydantic import ValidationError
+
+from src.bot.config import Settings
+
+
+def test_webhook_requires_secret(monkeypatch):
+    monkeypatch.setenv("WEBHOOK_URL", "https://example.com")
+    with pytest.raises(ValidationError, match="WEBHOOK_SECRET is required"):
+        Settings()
+
+
+@pytest.mark.parametrize("secret", ["", "has spaces", "pass/word", "x" * 257])
+def test_webhook_secret_characters_are_checked(monkeypatch, secret: str):
+    monkeypatch.setenv("WEBHOOK_URL", "https://example.com")
+    monkeypatch.setenv("WEBHOOK_SECRET", secret)
+    with pytest.raises(ValidationError, match="WEBHOOK_SECRET must be"):
+        Settings()
+
+
+def test_webhook_with_secret(monkeypatch):
+    monkeypatch.setenv("WEBHOOK_URL", "https://example.com")
+    monkeypatch.setenv("WEBHOOK_SECRET", "Long_random-secret_123")
+    assert Settings().WEBHOOK_SECRET == "Long_random-secret_123"
+
+
+def test_polling_needs_no_secret(monkeypatch):
+    monkeypatch.delenv("WEBHOOK_URL", raising=False)
+    monkeypatch.delenv("WEBHOOK_SECRET", raising=False)
+    assert Settings().WEBHOOK_SECRET is None
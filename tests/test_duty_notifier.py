@@ -0,0 +1,60 @@
+import asyncio
+from datetime import datetime, time, timezone
+
+import pytest
+
+from src.api.schemas.method_output_schemas import DailyInfoResponse, TaskDailyInfo
+from src.bot import duty_notifier
+from src.bot.cachers import RedisRoomRegistry
+from src.bot.duty_notifier import DutyNotifier
+
+DAILY_INFO = DailyInfoResponse(
+    periodic_tasks=[TaskDailyInfo(id=1, name="Trash", today_executor=10)],
+    manual_tasks=[TaskDailyInfo(id=2, name="Dishes", today_executor=20)],
+    user_info={},
+)
+
+
+class FakeClient:
+    async def get_daily_info(self, user_id: int, room_id: int | None = None) -> DailyInfoResponse:
+        # Let concurrent notifiers interleave.
+        await asyncio.sleep(0.01)
+        return DAILY_INFO
+
+
+class FakeSendQueue:
+    def __init__(self):
+        self.sent: list[tuple[int, str]] = []
+
+    async def send_message(self, bot, chat_id: int, text: str, **kwargs):
+        self.sent.append((chat_id, text))
+
+
+@pytest.fixture
+def send_queue(monkeypatch) -> FakeSendQueue:
+    queue = FakeSendQueue()
+    monkeypatch.setattr(duty_notifier, "client", FakeClient())
+    monkeypatch.setattr(duty_notifier, "send_queue", queue)
+    return queue
+
+
+def create_notifier(registry) -> DutyNotifier:
+    notifier = DutyNotifier(None, registry, timezone.utc, window_start=time(0), window_end=time.max)
+    # Every room is due as soon as the day starts.
+    notifier.slot = lambda room_id, day: datetime.combine(day, time(0), timezone.utc)
+    return notifier
+
+
+async def test_replicas_notify_a_room_once(redis, send_queue: FakeSendQueue):
+    registry = RedisRoomRegistry(redis)
+    await registry.add(1, 10)
+    await registry.add(2, 30)
+    replicas = [create_notifier(RedisRoomRegistry(redis)) for _ in range(3)]
+
+    await asyncio.gather(*(notifier.notify_due_rooms() for notifier in replicas))
+    # Each room has messages for two executors.
+    assert len(send_queue.sent) == 4
+    assert sorted(chat_id for chat_id, _ in send_queue.sent) == [10, 10, 20, 20]
+
+    await asyncio.gather(*(notifier.notify_due_rooms() for notifier in replicas))
+    assert len(send_queue.sent) == 4
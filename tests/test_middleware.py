@@ -0,0 +1,52 @@
+import pytest
+from aiogram.types import User
+
+from src.api.exceptions import APIError, Conflict, Unavailable
+from src.bot import middleware
+from src.bot.cachers import MemoryAliasCacher, UserInfo
+from src.bot.middleware import UpdateUserInfoMiddleware
+
+USER = User(id=1, is_bot=False, first_name="Full", last_name="Name", username="alias")
+
+
+class FakeClient:
+    def __init__(self, create_user_error: Exception | None):
+        self.create_user_error = create_user_error
+        self.saved: list[tuple[str, str | None]] = []
+
+    async def create_user(self, user_id: int) -> int:
+        if self.create_user_error is not None:
+            raise self.create_user_error
+        return user_id
+
+    async def save_user_alias(self, alias: str | None, user_id: int):
+        self.saved.append(("alias", alias))
+
+    async def save_user_fullname(self, fullname: str | None, user_id: int):
+        self.saved.append(("fullname", fullname))
+
+
+async def handler(event, data):
+    return "handled"
+
+
+@pytest.mark.parametrize(
+    "error",
+    [None, Conflict("User already exists", 400, 1), APIError("User already exists", 400)],
+)
+async def test_registered_user_is_handled(monkeypatch, error: Exception | None):
+    client = FakeClient(error)
+    monkeypatch.setattr(middleware, "client", client)
+    monkeypatch.setattr("src.bot.user_sync.client", client)
+    cache = MemoryAliasCacher()
+
+    result = await UpdateUserInfoMiddleware(cache)(handler, None, {"event_from_user": USER})
+    assert result == "handled"
+    assert client.saved == [("alias", "alias"), ("fullname", "Full Name")]
+    assert await cache.get(1) == UserInfo("alias", "Full Name")
+
+
+async def test_unavailable_backend_fails_the_update(monkeypatch):
+    monkeypatch.setattr(middleware, "client", FakeClient(Unavailable("timeout")))
+    with pytest.raises(Unavailable):
+        await UpdateUserInfoMiddleware(MemoryAliasCacher())(handler, None, {"event_from_user": USER})
@@ -0,0 +1,16 @@
+import pytest
+
+from src.api.exceptions import Conflict, Validation
+from src.bot.dialogs.invitation.outgoing_invitations import Events, InviteWindowConsts
+
+
+@pytest.mark.parametrize(
+    ("result", "text"),
+    [
+        (1, InviteWindowConsts.INVITATION_SENT_RESULT),
+        (Conflict("User is already invited", 400, 7), InviteWindowConsts.INVITATION_CONFLICT_RESULT),
+        (Validation('[{"loc": ["body", "addressee", "alias"]}]', 422), InviteWindowConsts.INVITATION_INVALID_RESULT),
+    ],
+)
+def test_backend_details_are_not_shown(result, text: str):
+    assert Events.invitation_result(result) == text
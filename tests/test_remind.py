@@ -0,0 +1,39 @@
+import asyncio
+from types import SimpleNamespace
+
+from src.api.schemas.method_output_schemas import UserInfo
+from src.bot import utils
+from src.bot.cachers import MemoryRemindRegistry
+from src.bot.send_queue import SendQueue
+
+EXECUTOR = UserInfo(id=2, alias="executor", fullname="Executor")
+
+
+class SlowFailingBot:
+    async def send_message(self, chat_id: int, text: str, **kwargs):
+        await asyncio.sleep(0.2)
+        raise RuntimeError("Forbidden: bot was blocked by the user")
+
+
+class FakeCallback:
+    def __init__(self, bot):
+        self.bot = bot
+        self.from_user = SimpleNamespace(full_name="Roommate")
+        self.answers: list[str] = []
+
+    async def answer(self, text: str):
+        self.answers.append(text)
+
+
+async def test_reminder_failed_after_timeout_is_forgotten(monkeypatch):
+    queue = SendQueue(reply_timeout=0.1)
+    monkeypatch.setattr(utils, "send_queue", queue)
+    registry = MemoryRemindRegistry()
+    manager = SimpleNamespace(middleware_data={"remind_registry": registry})
+
+    callback = FakeCallback(SlowFailingBot())
+    await utils.remind_executor(callback, manager, "periodic:1", "Trash", EXECUTOR)
+    await asyncio.sleep(0.3)
+    # The executor has not been reminded, so the next tap is not refused.
+    assert await registry.try_remind("periodic:1:2", 60) is None
+    await queue.stop()
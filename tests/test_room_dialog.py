@@ -0,0 +1,11 @@
+import pytest
+
+from src.bot.config import get_settings
+from src.bot.dialogs.room import MainWindowConsts, room_dialog
+
+
+@pytest.mark.parametrize(("source", "shown"), [("backend", False), ("local", True)])
+def test_schedule_is_shown_with_local_rotation(monkeypatch, source: str, shown: bool):
+    monkeypatch.setattr(get_settings(), "ROTATION_SOURCE", source)
+    button = room_dialog.find(MainWindowConsts.SCHEDULE_BUTTON_ID)
+    assert button.is_({}, None) is shown
@@ -0,0 +1,99 @@
+import itertools
+import json
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from src.api.schemas.method_output_schemas import TaskCurrent, TaskInfoResponse, UserInfo
+from src.bot.rotation import current_executor, duties, executor_number
+
+ANSWERS = json.loads((Path(__file__).parent / "fixtures" / "current_executor_answers.json").read_text())
+
+USERS = [UserInfo(id=i, alias=f"user_{i}", fullname=f"User {i}") for i in range(3)]
+START = datetime(2024, 9, 1, 20, 0)
+
+
+def make_task(start_date: datetime = START, period: int = 2, inactive: bool = False) -> TaskInfoResponse:
+    return TaskInfoResponse(
+        name="Trash", description=None, start_date=start_date, period=period, order_id=1, inactive=inactive
+    )
+
+
+@pytest.mark.parametrize("answer", ANSWERS, ids=lambda answer: f"{answer['task']['name']}@{answer['at']}")
+def test_matches_backend(answer: dict):
+    task = TaskInfoResponse.model_validate(answer["task"])
+    order = [UserInfo.model_validate(user) for user in answer["order"]]
+    expected = TaskCurrent.model_validate(answer["current"]) if answer["current"] is not None else None
+    assert current_executor(task, order, datetime.fromisoformat(answer["at"])) == expected
+
+
+@pytest.mark.parametrize(
+    ("at", "number"),
+    [
+        (START, 0),
+        (START + timedelta(days=1, hours=23, minutes=59), 0),
+        (START + timedelta(days=2), 1),
+        (START + timedelta(days=4), 2),
+        # Back to the start of the order.
+        (START + timedelta(days=6), 0),
+        (START + timedelta(days=6 * 100 + 3), 1),
+    ],
+)
+def test_executor_number(at: datetime, number: int):
+    assert executor_number(make_task(), len(USERS), at) == number
+
+
+def test_turn_changes_at_start_time():
+    # A day of turns starts at the time of day of the start date, not at midnight.
+    task = make_task(period=1)
+    assert executor_number(task, len(USERS), datetime(2024, 9, 2, 19, 59)) == 0
+    assert executor_number(task, len(USERS), datetime(2024, 9, 2, 20, 0)) == 1
+
+
+@pytest.mark.parametrize(
+    ("task", "executors_count", "at"),
+    [
+        (make_task(), len(USERS), START - timedelta(minutes=1)),
+        (make_task(inactive=True), len(USERS), START),
+        (make_task(), 0, START),
+    ],
+    ids=["not started", "inactive", "no executors"],
+)
+def test_nobody_on_duty(task: TaskInfoResponse, executors_count: int, at: datetime):
+    assert executor_number(task, executors_count, at) is None
+    assert current_executor(task, USERS[:executors_count], at) is None
+
+
+def test_current_executor():
+    assert current_executor(make_task(), USERS, START + timedelta(days=2)) == TaskCurrent(number=1, user=USERS[1])
+
+
+def test_current_executor_is_computed_now_by_default():
+    task = make_task(start_date=datetime.now(timezone.utc) - timedelta(days=2, minutes=1))
+    assert current_executor(task, USERS) == TaskCurrent(number=1, user=USERS[1])
+
+
+def test_duties_start_with_the_turn_in_progress():
+    since = START + timedelta(days=3)
+    turns = list(itertools.islice(duties(make_task(), USERS, since), 4))
+    assert [start for start, _ in turns] == [START + timedelta(days=2 * i) for i in range(1, 5)]
+    assert [current.number for _, current in turns] == [1, 2, 0, 1]
+
+
+def test_duties_agree_with_current_executor():
+    task = make_task(period=3)
+    for start, current in itertools.islice(duties(task, USERS, START), 10):
+        assert current_executor(task, USERS, start) == current
+        assert current_executor(task, USERS, start + timedelta(days=task.period) - timedelta(seconds=1)) == current
+
+
+def test_duties_of_not_started_task():
+    start, current = next(duties(make_task(), USERS, START - timedelta(days=10)))
+    assert start == START
+    assert current == TaskCurrent(number=0, user=USERS[0])
+
+
+def test_no_duties():
+    assert list(duties(make_task(inactive=True), USERS, START)) == []
+    assert list(duties(make_task(), [], START)) == []
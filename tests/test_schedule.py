@@ -0,0 +1,68 @@
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from src.api.schemas.method_output_schemas import TaskInfoResponse, UserInfo
+from src.bot.rotation import current_executor
+from src.bot.schedule import _next_change, build_schedule
+
+USERS = [UserInfo(id=i, alias=f"user_{i}", fullname=f"User {i}") for i in range(3)]
+MOSCOW = ZoneInfo("Europe/Moscow")
+
+
+def make_task(start_date: datetime, period: int = 1, name: str = "Trash") -> TaskInfoResponse:
+    return TaskInfoResponse(
+        name=name, description=None, start_date=start_date, period=period, order_id=1, inactive=False
+    )
+
+
+def test_first_day_matches_task_view():
+    # A turn has started at 20:00, which a schedule counted by dates would show as the next turn on the next day.
+    task = make_task(datetime(2025, 1, 1, 20, 0, tzinfo=MOSCOW))
+    now = datetime(2025, 1, 2, 10, 0, tzinfo=MOSCOW)
+    schedule = build_schedule([(task, USERS)], now, 3)
+    assert current_executor(task, USERS, now).user == USERS[0]
+    assert [day.duties for day in schedule] == [[("Trash", USERS[0])], [("Trash", USERS[1])], [("Trash", USERS[2])]]
+    assert [day.day.day for day in schedule] == [2, 3, 4]
+
+
+@pytest.mark.parametrize(
+    "start_date",
+    [
+        datetime(2025, 1, 1, 20, 0, tzinfo=MOSCOW),
+        datetime(2025, 1, 1, 23, 30, tzinfo=timezone.utc),
+        datetime(2025, 1, 5, 9, 0, tzinfo=timezone.utc),
+        datetime(2025, 1, 1, 20, 0),
+    ],
+    ids=["moscow", "utc", "not started", "naive"],
+)
+@pytest.mark.parametrize("period", [1, 2, 3])
+@pytest.mark.parametrize("hour", [0, 10, 21])
+def test_days_match_current_executor(start_date: datetime, period: int, hour: int):
+    task = make_task(start_date, period)
+    now = datetime(2025, 1, 2, hour, 0, tzinfo=MOSCOW)
+    schedule = build_schedule([(task, USERS)], now, 14)
+    for i, day in enumerate(schedule):
+        # The moment as the task view takes it, ``datetime.now(task.start_date.tzinfo)``.
+        at = (now + timedelta(days=i)).astimezone(start_date.tzinfo)
+        if start_date.tzinfo is None:
+            at = at.replace(tzinfo=None)
+        expected = current_executor(task, USERS, at)
+        assert day.duties == ([("Trash", expected.user)] if expected is not None else [])
+
+
+def test_tasks_without_executors_are_skipped():
+    now = datetime(2025, 1, 2, 10, 0, tzinfo=MOSCOW)
+    tasks = [(make_task(datetime(2025, 1, 1, tzinfo=MOSCOW), name="Dishes"), []), (make_task(now), USERS)]
+    assert [day.duties for day in build_schedule(tasks, now, 2)] == [[("Trash", USERS[0])], [("Trash", USERS[1])]]
+
+
+def test_next_change_is_the_nearest_turn_start():
+    now = datetime(2025, 1, 2, 10, 0, tzinfo=MOSCOW)
+    tasks = [
+        (make_task(datetime(2025, 1, 1, 20, 0, tzinfo=MOSCOW)), USERS),
+        (make_task(datetime(2025, 1, 1, 15, 0, tzinfo=timezone.utc), period=2), USERS),
+    ]
+    assert _next_change(tasks, now) == datetime(2025, 1, 2, 20, 0, tzinfo=MOSCOW)
+    assert _next_change([], now) is None
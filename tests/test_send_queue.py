@@ -0,0 +1,100 @@
+import asyncio
+import time
+
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.methods import SendMessage
+
+from src.bot.send_queue import Priority, SendQueue
+
+
+class FakeBot:
+    def __init__(self, flood_control: int = 0, retry_after: int = 1):
+        self.flood_control = flood_control
+        self.retry_after = retry_after
+        self.sent: list[tuple[int, str]] = []
+
+    async def send_message(self, chat_id: int, text: str, **kwargs):
+        if self.flood_control:
+            self.flood_control -= 1
+            method = SendMessage(chat_id=chat_id, text=text)
+            raise TelegramRetryAfter(method, "Too Many Requests", self.retry_after)
+        self.sent.append((chat_id, text))
+        return text
+
+
+async def test_reply_is_sent():
+    queue = SendQueue(reply_timeout=1)
+    bot = FakeBot()
+    assert await queue.send_message(bot, 1, "Hello") == "Hello"
+    await queue.stop()
+
+
+async def test_reply_does_not_wait_for_flood_control():
+    queue = SendQueue(reply_timeout=0.1)
+    bot = FakeBot(flood_control=1, retry_after=1)
+
+    started = time.monotonic()
+    assert await queue.send_message(bot, 1, "Hello") is None
+    assert time.monotonic() - started < 0.5
+    assert bot.sent == []
+
+    # The message stays queued and is sent once the chat is resumed.
+    async with asyncio.timeout(2):
+        while not bot.sent:
+            await asyncio.sleep(0.05)
+    assert bot.sent == [(1, "Hello")]
+    await queue.stop()
+
+
+async def test_late_failure_is_logged(caplog):
+    class SlowFailingBot:
+        async def send_message(self, chat_id: int, text: str, **kwargs):
+            await asyncio.sleep(0.2)
+            raise RuntimeError("Chat not found")
+
+    queue = SendQueue(reply_timeout=0.1)
+    bot = SlowFailingBot()
+    assert await queue.send_message(bot, 1, "Hello") is None
+    await asyncio.sleep(0.3)
+    assert "Failed to send a message to chat 1" in caplog.text
+    await queue.stop()
+
+
+async def test_broadcast_waits_for_delivery():
+    queue = SendQueue(reply_timeout=0.1)
+    bot = FakeBot(flood_control=1, retry_after=1)
+    assert await queue.send_message(bot, 1, "Your duties", priority=Priority.BROADCAST) == "Your duties"
+    await queue.stop()
+
+
+async def test_late_failure_callback():
+    class SlowFailingBot:
+        async def send_message(self, chat_id: int, text: str, **kwargs):
+            await asyncio.sleep(0.2)
+            raise RuntimeError("Chat not found")
+
+    failures = []
+
+    async def on_late_failure():
+        failures.append(1)
+
+    queue = SendQueue(reply_timeout=0.1)
+    assert await queue.send_message(SlowFailingBot(), 1, "Hello", on_late_failure=on_late_failure) is None
+    assert failures == []
+    await asyncio.sleep(0.3)
+    assert failures == [1]
+    await queue.stop()
+
+
+async def test_late_failure_callback_is_not_called_on_delivery():
+    failures = []
+
+    async def on_late_failure():
+        failures.append(1)
+
+    queue = SendQueue(reply_timeout=0.1)
+    bot = FakeBot(flood_control=1, retry_after=1)
+    assert await queue.send_message(bot, 1, "Hello", on_late_failure=on_late_failure) is None
+    await queue.stop()
+    assert bot.sent == [(1, "Hello")]
+    assert failures == []
@@ -0,0 +1,69 @@
+import dataclasses
+import os
+import pickle
+import re
+from datetime import datetime
+
+import msgpack
+import pytest
+
+from src.api.schemas.method_output_schemas import TaskCurrent, TaskInfoResponse, UserInfo
+from src.bot.dialogs.dialog_communications import PromptDialogStartData
+from src.bot.serialization import COMPACT_TYPES, DialogDataSerializer
+from src.bot.utils import datetime_validator, positive_int_validator
+
+
+# Versions of the same dataclass before and after a change of its fields.
+Form = dataclasses.make_dataclass("Form", [("name", str), ("period", int)])
+ReorderedForm = dataclasses.make_dataclass("Form", [("period", int), ("name", str)])
+ExtendedForm = dataclasses.make_dataclass("Form", [("name", str), ("period", int), ("description", str | None, None)])
+
+
+def test_round_trip():
+    serializer = DialogDataSerializer()
+    data = {
+        "task": TaskInfoResponse(
+            name="Trash", description=None, start_date=datetime(2024, 9, 1, 10), period=2, order_id=5, inactive=False
+        ),
+        "current": TaskCurrent(number=1, user=UserInfo(id=1, alias=None, fullname="Full Name")),
+        "prompt": PromptDialogStartData("a new name", filter=re.compile(r".+")),
+        "filters": [datetime_validator, positive_int_validator],
+        "pair": (1, "a"),
+        "aiogd_stack": {"intents": ["a", "b"]},
+    }
+    assert serializer.loads(serializer.dumps(data)) == data
+
+
+@pytest.mark.parametrize("changed", [ReorderedForm, ExtendedForm])
+def test_changed_fields_are_unreadable(changed: type):
+    stored = DialogDataSerializer([*COMPACT_TYPES, Form]).dumps({"form": Form("Trash", 2)})
+    with pytest.raises(ValueError):
+        DialogDataSerializer([*COMPACT_TYPES, changed]).loads(stored)
+
+
+def test_unknown_type_index_is_unreadable():
+    stored = DialogDataSerializer([*COMPACT_TYPES, Form]).dumps({"form": Form("Trash", 2)})
+    with pytest.raises(ValueError):
+        DialogDataSerializer().loads(stored)
+
+
+@pytest.mark.parametrize("obj", [os.system, lambda text: True, DialogDataSerializer, {1, 2}])
+def test_unsupported_types_are_not_stored(obj):
+    with pytest.raises(TypeError):
+        DialogDataSerializer().dumps({"value": obj})
+
+
+@pytest.mark.parametrize(
+    "ext",
+    [
+        # Formats of older versions: a pickle and a function by its import path.
+        msgpack.ExtType(0, pickle.dumps(datetime(2024, 9, 1))),
+        msgpack.ExtType(4, b"os:system"),
+        # A function outside of the allowed ones.
+        msgpack.ExtType(6, msgpack.packb(100)),
+        msgpack.ExtType(6, msgpack.packb("os:system")),
+    ],
+)
+def test_references_are_not_loaded(ext: msgpack.ExtType):
+    with pytest.raises(ValueError):
+        DialogDataSerializer().loads(msgpack.packb({"value": ext}))
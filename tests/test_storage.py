@@ -0,0 +1,55 @@
+import dataclasses
+from datetime import datetime
+
+from aiogram.fsm.storage.base import StorageKey
+
+from src.api.schemas.method_output_schemas import TaskInfoResponse, UserInfo
+from src.bot.dialogs.dialog_communications import ConfirmationDialogStartData
+from src.bot.serialization import COMPACT_TYPES, DialogDataSerializer
+from src.bot.storage import DialogRedisStorage
+
+KEY = StorageKey(bot_id=1, chat_id=2, user_id=3, destiny="aiogd:context")
+
+
+async def test_data_round_trip(redis):
+    storage = DialogRedisStorage(redis, data_ttl=60)
+    data = {
+        "task": TaskInfoResponse(
+            name="Trash", description=None, start_date=datetime(2024, 9, 1, 10), period=2, order_id=5, inactive=False
+        ),
+        "executors": [UserInfo(id=1, alias="alias", fullname="Full Name")],
+        "input": ConfirmationDialogStartData("delete the task"),
+        "nested": {"ids": [1, 2, 3], "flag": True, "text": None},
+    }
+    await storage.set_data(KEY, data)
+    assert await storage.get_data(KEY) == data
+    assert 0 < await redis.ttl(storage.key_builder.build(KEY, "data")) <= 60
+
+
+async def test_state_round_trip(redis):
+    storage = DialogRedisStorage(redis)
+    await storage.set_state(KEY, "RoomSG:main")
+    assert await storage.get_state(KEY) == "RoomSG:main"
+
+
+async def test_empty_data_is_deleted(redis):
+    storage = DialogRedisStorage(redis)
+    await storage.set_data(KEY, {"a": 1})
+    await storage.set_data(KEY, {})
+    assert await redis.exists(storage.key_builder.build(KEY, "data")) == 0
+    assert await storage.get_data(KEY) == {}
+
+
+async def test_unreadable_data_is_dropped(redis):
+    storage = DialogRedisStorage(redis)
+    await redis.set(storage.key_builder.build(KEY, "data"), b'{"written": "as json"}')
+    assert await storage.get_data(KEY) == {}
+
+
+async def test_data_of_changed_types_is_dropped(redis):
+    old_task = dataclasses.make_dataclass("Task", [("name", str), ("period", int)])
+    new_task = dataclasses.make_dataclass("Task", [("name", str), ("description", str), ("period", int)])
+    old = DialogRedisStorage(redis, serializer=DialogDataSerializer([*COMPACT_TYPES, old_task]))
+    new = DialogRedisStorage(redis, serializer=DialogDataSerializer([*COMPACT_TYPES, new_task]))
+    await old.set_data(KEY, {"task": old_task("Trash", 2)})
+    assert await new.get_data(KEY) == {}